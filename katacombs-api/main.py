@@ -4,13 +4,21 @@ Following DDD and Hexagonal Architecture principles
 
 import uvicorn
 
-from src.katacombs.infrastructure.adapters.fastapi_app import create_app
+from src.game.infrastructure.adapters.fastapi_app import create_app
 
 
 def main() -> None:
     """Main entry point for the application."""
     app = create_app()
-    uvicorn.run(app, host="127.0.0.1", port=8000)
+    uvicorn.run(
+        app,
+        host="127.0.0.1",
+        port=8000,
+        loop="auto",
+        http="auto",
+        log_level="warning",
+        access_log=False,
+    )
 
 
 if __name__ == "__main__":
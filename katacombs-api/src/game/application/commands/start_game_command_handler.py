@@ -1,5 +1,5 @@
 from ...domain.player import Bag, Player, PlayerRepository, Sid
-from ...domain.world import WorldRepository
+from ...domain.world import Location, World, WorldRepository
 from .start_game_dto import (
     BagData,
     ItemData,
@@ -31,12 +31,14 @@ class StartGameCommandHandler:
     def execute(self, command: StartGameCommand) -> StartGameResponse:
         """Execute the start game use case"""
         try:
+            # Validate the SID first so a malformed one never reaches the repositories
+            player_sid = Sid(command.player_sid)
+
             world = self._world_repository.get_world()
             starting_location = world.get_starting_location()
             if not starting_location:
                 return StartGameResponse.error_response("No starting location found")
 
-            player_sid = Sid(command.player_sid)
             empty_bag = Bag()
             player = Player.create(
                 player_sid, command.player_name, starting_location.sid, empty_bag
@@ -49,11 +51,8 @@ class StartGameCommandHandler:
 
         except ValueError as e:
             return StartGameResponse.error_response(str(e))
-        except (RuntimeError, OSError, KeyError) as e:
-            error_msg = f"Failed to start game: {e!s}"
-            return StartGameResponse.error_response(error_msg)
 
-    def _convert_player_to_data(self, player: Player, world) -> PlayerData:
+    def _convert_player_to_data(self, player: Player, world: World) -> PlayerData:
         """Convert domain Player to PlayerData DTO
 
         Args:
@@ -66,27 +65,27 @@ class StartGameCommandHandler:
             msg = f"Location not found for player: {player.location_sid}"
             raise ValueError(msg)
 
-        location_items = [
-            ItemData(sid=str(item.sid.value), name=item.name, description=item.description)
-            for item in location.items
-        ]
+        location_data = self._convert_location_to_data(location)
 
-        location_data = LocationData(
-            description=location.description,
-            exits=[direction.value for direction in location.get_available_directions()],
-            items=location_items,
+        bag_items = tuple(
+            ItemData(sid=item.sid.value, name=item.name, description=item.description)
+            for item_sid in player.bag
+            if (item := world.get_item_by_sid(item_sid)) is not None
         )
 
-        bag_items = []
-        for item_sid in player.bag.item_sids:
-            item = world.get_item_by_sid(item_sid)
-            if item:
-                bag_items.append(
-                    ItemData(sid=str(item.sid.value), name=item.name, description=item.description)
-                )
-
         bag_data = BagData(items=bag_items)
 
         return PlayerData(
-            sid=str(player.sid.value), name=player.name, location=location_data, bag=bag_data
+            sid=player.sid.value, name=player.name, location=location_data, bag=bag_data
+        )
+
+    def _convert_location_to_data(self, location: Location) -> LocationData:
+        """Convert a Location to LocationData"""
+        return LocationData(
+            description=location.description,
+            exits=location.get_available_direction_values(),
+            items=tuple(
+                ItemData(sid=item.sid.value, name=item.name, description=item.description)
+                for item in location.items
+            ),
         )
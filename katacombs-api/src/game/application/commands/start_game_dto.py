@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemData:
     """Item data for response"""
 
@@ -10,23 +10,23 @@ class ItemData:
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class LocationData:
     """Location data for response"""
 
     description: str
-    exits: list[str]
-    items: list[ItemData]
+    exits: tuple[str, ...]
+    items: tuple[ItemData, ...]
 
 
-@dataclass
+@dataclass(slots=True)
 class BagData:
     """Bag data for response"""
 
-    items: list[ItemData]
+    items: tuple[ItemData, ...]
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerData:
     """Player data for response"""
 
@@ -36,7 +36,7 @@ class PlayerData:
     bag: BagData
 
 
-@dataclass
+@dataclass(slots=True)
 class StartGameCommand:
     """Command to start a new game"""
 
@@ -44,7 +44,7 @@ class StartGameCommand:
     player_sid: str
 
 
-@dataclass
+@dataclass(slots=True)
 class StartGameResponse:
     """Response after starting a new game"""
 
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from .player_projection_repository import PlayerListItemDto, PlayerProjectionRepository
 
 
-@dataclass
+@dataclass(slots=True)
 class GetAllActivePlayersQuery:
     """Query to get all active players
 
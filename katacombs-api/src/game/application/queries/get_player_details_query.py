@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from .player_projection_repository import PlayerDetailsDto, PlayerProjectionRepository
 
 
-@dataclass
+@dataclass(slots=True)
 class GetPlayerDetailsQuery:
     """Query to get detailed information about a specific player
 
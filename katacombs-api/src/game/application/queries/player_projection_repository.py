@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerListItemDto:
     """DTO for player list item - shaped for UI display
 
@@ -18,7 +18,7 @@ class PlayerListItemDto:
     is_active: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerDetailsDto:
     """DTO for detailed player information"""
 
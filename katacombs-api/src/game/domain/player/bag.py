@@ -1,34 +1,54 @@
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 
 from .sid import Sid
 
 
-@dataclass
+@dataclass(slots=True, init=False, repr=False)
 class Bag:
-    """Bag value object for holding player's items"""
+    """Bag value object for holding player's items
 
-    item_sids: list[Sid] = field(default_factory=list)
+    Item SIDs are kept as dict keys: insertion ordered with O(1) membership.
+    A bag holds each item at most once, and two bags are equal when they hold
+    the same items, whatever order they were added in.
+    """
+
+    _item_sids: dict[Sid, None] = field()
+
+    def __init__(self, item_sids: Iterable[Sid] = ()) -> None:
+        self._item_sids = dict.fromkeys(item_sids)
+
+    def __repr__(self) -> str:
+        return f"Bag(item_sids={self.item_sids!r})"
+
+    @property
+    def item_sids(self) -> list[Sid]:
+        """Item SIDs in the order they were added (a copy; use add/remove to change)"""
+        return list(self._item_sids)
+
+    def __iter__(self) -> Iterator[Sid]:
+        """Iterate item SIDs in the order they were added"""
+        return iter(self._item_sids)
 
     def add_item(self, item_sid: Sid) -> None:
         """Add item to bag by its SID"""
-        self.item_sids.append(item_sid)
+        self._item_sids[item_sid] = None
 
     def remove_item(self, item_sid: Sid) -> bool:
         """Remove item from bag by its SID, return success"""
-        try:
-            self.item_sids.remove(item_sid)
-            return True
-        except ValueError:
+        if item_sid not in self._item_sids:
             return False
+        del self._item_sids[item_sid]
+        return True
 
     def has_item(self, item_sid: Sid) -> bool:
         """Check if bag contains item"""
-        return item_sid in self.item_sids
+        return item_sid in self._item_sids
 
     def is_empty(self) -> bool:
         """Check if bag is empty"""
-        return len(self.item_sids) == 0
+        return len(self._item_sids) == 0
 
     def item_count(self) -> int:
         """Get number of items in bag"""
-        return len(self.item_sids)
+        return len(self._item_sids)
@@ -4,7 +4,7 @@ from .bag import Bag
 from .sid import Sid
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class Player:
     """Player Aggregate Root
     Represents a player in the Katacombs game
@@ -19,11 +19,12 @@ class Player:
     @classmethod
     def create(cls, sid: Sid, name: str, location_sid: Sid, bag: Bag) -> "Player":
         """Factory method for creating a new Player"""
-        if not name.strip():
+        name = name.strip()
+        if not name:
             msg = "Player name cannot be empty"
             raise ValueError(msg)
 
-        return cls(sid=sid, name=name.strip(), location_sid=location_sid, bag=bag, is_active=True)
+        return cls(sid=sid, name=name, location_sid=location_sid, bag=bag, is_active=True)
 
     def move_to_location(self, new_location_sid: Sid) -> None:
         """Move player to a new location"""
@@ -1,9 +1,10 @@
 import re
-from dataclasses import dataclass
-from typing import ClassVar
+from dataclasses import dataclass, field
 
+_SID_RE = re.compile(r"[0-9]{6}-[0-9]{12}-[0-9]{8}")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, eq=False, slots=True)
 class Sid:
     """Session ID value object
 
@@ -15,17 +16,36 @@ class Sid:
     """
 
     value: str
-
-    PATTERN: ClassVar[str] = r"^[0-9]{6}-[0-9]{12}-[0-9]{8}$"
+    _hash: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        if not self._is_valid(self.value):
+        if not self.is_valid(self.value):
             msg = f"Invalid Sid format: {self.value}"
             raise ValueError(msg)
+        object.__setattr__(self, "_hash", hash(self.value))
 
     @classmethod
-    def _is_valid(cls, value: str) -> bool:
-        return bool(re.match(cls.PATTERN, value))
+    def unchecked(cls, value: str) -> "Sid":
+        """Build a Sid from a trusted, already valid value without re-running validation
+
+        Only for internal sources such as SidGenerator; external input must use Sid(value).
+        """
+        sid = object.__new__(cls)
+        object.__setattr__(sid, "value", value)
+        object.__setattr__(sid, "_hash", hash(value))
+        return sid
+
+    @classmethod
+    def is_valid(cls, value: str) -> bool:
+        """Check a raw value against the Sid format without raising"""
+        return _SID_RE.fullmatch(value) is not None
+
+    def __eq__(self, other: object) -> bool:
+        return type(other) is Sid and other.value == self.value
+
+    def __hash__(self) -> int:
+        # Computed once in __post_init__; Sid is frozen so it cannot go stale
+        return self._hash
 
     def __str__(self) -> str:
         return self.value
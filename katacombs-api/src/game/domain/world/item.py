@@ -4,7 +4,7 @@ from ..player.sid import Sid
 from .action import Action
 
 
-@dataclass
+@dataclass(slots=True)
 class Item:
     sid: Sid
     name: str
@@ -1,29 +1,63 @@
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
 
 from ..player.sid import Sid
 from .direction import Direction
 from .item import Item
 
 
-@dataclass
+@dataclass(slots=True)
 class Location:
     sid: Sid
     description: str
-    exits: dict[Direction, Sid | None] = field(default_factory=dict)
     items: list[Item] = field(default_factory=list)
+    # Exits change only through add_exit, which keeps the direction caches in step
+    _exits: dict[Direction, Sid | None] = field(default_factory=dict, init=False)
+    _exits_view: Mapping[Direction, Sid | None] = field(init=False, repr=False, compare=False)
+    _available_directions: tuple[Direction, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _direction_values: tuple[str, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         if not self.description.strip():
             msg = "Location description cannot be empty"
             raise ValueError(msg)
+        self._exits_view = MappingProxyType(self._exits)
+
+    @property
+    def exits(self) -> Mapping[Direction, Sid | None]:
+        """Read-only view of the exits; use add_exit to change them"""
+        return self._exits_view
 
     def add_exit(self, direction: Direction, destination_sid: Sid | None = None) -> None:
-        self.exits[direction] = destination_sid
+        self._exits[direction] = destination_sid
+        self._available_directions = None
+        self._direction_values = None
+
+    def get_available_directions(self) -> tuple[Direction, ...]:
+        """Connected exits, cached until the next add_exit
+
+        Returned as a tuple, not a list, so callers cannot mutate the cached value.
+        """
+        if self._available_directions is None:
+            self._available_directions = tuple(
+                direction
+                for direction, destination in self._exits.items()
+                if destination is not None
+            )
+        return self._available_directions
 
-    def get_available_directions(self) -> list[Direction]:
-        return [
-            direction for direction, destination in self.exits.items() if destination is not None
-        ]
+    def get_available_direction_values(self) -> tuple[str, ...]:
+        """Available directions as strings, cached until the next add_exit"""
+        if self._direction_values is None:
+            self._direction_values = tuple(
+                direction.value for direction in self.get_available_directions()
+            )
+        return self._direction_values
 
     def add_item(self, item: Item) -> None:
         self.items.append(item)
@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
 from ..player.sid import Sid
 from .location import Location
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from .item import Item
+
 
 class World:
     """Domain entity representing the complete game world
@@ -12,13 +20,19 @@ class World:
     """
 
     def __init__(self, locations: dict[Sid, Location], starting_location_sid: Sid) -> None:
-        self._locations = locations.copy()  # Defensive copy
+        self._locations = locations.copy()  # Defensive copy, WorldBuilder keeps its dict
+        self._locations_view = MappingProxyType(self._locations)
         self._starting_location_sid = starting_location_sid
 
         # Validate starting location exists
         if starting_location_sid not in self._locations:
             raise ValueError(f"Starting location {starting_location_sid} not found in world")
 
+        # Remember which location holds each item so SID lookups don't scan every location
+        self._item_locations: dict[Sid, Location] = {
+            item.sid: location for location in self._locations.values() for item in location.items
+        }
+
     @property
     def starting_location_sid(self) -> Sid:
         """Get the SID of the starting location"""
@@ -32,18 +46,35 @@ class World:
         """Get the starting location for new players"""
         return self._locations[self._starting_location_sid]
 
-    def get_all_locations(self) -> dict[Sid, Location]:
-        """Get all locations in the world (defensive copy)"""
-        return self._locations.copy()
+    def get_all_locations(self) -> Mapping[Sid, Location]:
+        """Get all locations in the world (read-only view, not a copy)"""
+        return self._locations_view
 
     def has_location(self, location_sid: Sid) -> bool:
         """Check if a location exists in the world"""
         return location_sid in self._locations
 
-    def get_item_by_sid(self, item_sid: Sid):
-        """Get an item by its SID from any location in the world"""
+    def get_item_by_sid(self, item_sid: Sid) -> Item | None:
+        """Get an item by its SID from any location in the world
+
+        Items are indexed by location when the world is built. Locations can still
+        gain or lose items afterwards, so the indexed location is re-checked and a
+        miss falls back to a scan that re-indexes what it finds.
+        """
+        indexed_location = self._item_locations.get(item_sid)
+        if indexed_location is not None:
+            item = self._find_item_in(indexed_location, item_sid)
+            if item is not None:
+                return item
+            del self._item_locations[item_sid]
+
         for location in self._locations.values():
-            for item in location.items:
-                if item.sid == item_sid:
-                    return item
-        return None
\ No newline at end of file
+            item = self._find_item_in(location, item_sid)
+            if item is not None:
+                self._item_locations[item_sid] = location
+                return item
+        return None
+
+    @staticmethod
+    def _find_item_in(location: Location, item_sid: Sid) -> Item | None:
+        return next((item for item in location.items if item.sid == item_sid), None)
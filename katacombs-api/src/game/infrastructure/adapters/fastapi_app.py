@@ -1,119 +1,129 @@
 from typing import Annotated, cast
 
-from fastapi import Depends, FastAPI, HTTPException
+import msgspec
+from fastapi import Depends, FastAPI, Request
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
-from ...application.commands import (
-    PlayerData,
-    StartGameCommand,
-    StartGameCommandHandler,
+from ...application.commands import StartGameCommand, StartGameCommandHandler
+from ...infrastructure.repositories.in_memory_player_projection_repository import (
+    InMemoryPlayerProjectionRepository,
 )
 from ...infrastructure.repositories.in_memory_player_repository import InMemoryPlayerRepository
 from ...infrastructure.repositories.in_memory_world_repository import InMemoryWorldRepository
 
+_json_encoder = msgspec.json.Encoder()
+
+
+class MsgspecJSONResponse(JSONResponse):
+    """JSON response rendered by msgspec's C encoder instead of the stdlib json module"""
+
+    def render(self, content: object) -> bytes:
+        return _json_encoder.encode(content)
+
 
 class StartGameRequest(BaseModel):
     name: str
     sid: str
 
 
+class ItemResponse(BaseModel):
+    sid: str
+    name: str
+    description: str
+
+
+class LocationResponse(BaseModel):
+    description: str
+    exits: list[str]
+    items: list[ItemResponse]
+
+
+class BagResponse(BaseModel):
+    items: list[ItemResponse]
+
+
 class PlayerResponse(BaseModel):
     sid: str
     name: str
-    location: dict[str, object]
-    bag: dict[str, object]
+    location: LocationResponse
+    bag: BagResponse
 
 
 class ErrorResponse(BaseModel):
     error: str
 
 
-def _validate_request(request: StartGameRequest) -> None:
-    """Validate start game request"""
-    if not request.name or not request.name.strip():
-        raise HTTPException(status_code=400, detail="Player name cannot be empty")
+def _create_start_game_command_handler(
+    world_repo: InMemoryWorldRepository, projection: InMemoryPlayerProjectionRepository
+) -> StartGameCommandHandler:
+    """Wire the start game command handler to its repositories
+
+    Saved players are projected into the read model shared with query handlers.
+    """
+    player_repo = InMemoryPlayerRepository(projection)
+    return StartGameCommandHandler(player_repo, world_repo)
 
 
-def _raise_error_response(error_message: str) -> None:
-    """Raise HTTP exception for error response"""
-    raise HTTPException(status_code=400, detail=error_message)
+async def get_start_game_command_handler(request: Request) -> StartGameCommandHandler:
+    """Dependency injection for start game command handler
+
+    The handler is built once per app in create_app, not once per request.
+    Async so FastAPI resolves it on the event loop instead of the threadpool.
+    """
+    return cast("StartGameCommandHandler", request.app.state.start_game_command_handler)
 
 
-def _raise_server_error(message: str) -> None:
-    """Raise HTTP exception for server error"""
-    raise HTTPException(status_code=500, detail=message)
+async def start_game(
+    request: StartGameRequest,
+    command_handler: Annotated[StartGameCommandHandler, Depends(get_start_game_command_handler)],
+) -> MsgspecJSONResponse:
+    """Start a new game with a new player
+    Driving adapter - converts HTTP requests to domain commands
 
+    Declared async so it runs on the event loop without a threadpool hop.
+    This is only safe while the repositories are in-memory; switch to a
+    plain def once a handler performs blocking I/O.
 
-def _execute_start_game_command(
-    command_handler: StartGameCommandHandler, request: StartGameRequest
-) -> PlayerResponse:
-    """Execute start game command and return response"""
-    _validate_request(request)
+    Failed commands are returned as a 400 response rather than raised;
+    unexpected errors become a generic JSON 500 (see _handle_unexpected_error).
+    """
     command = StartGameCommand(player_name=request.name, player_sid=request.sid)
     result = command_handler.execute(command)
 
     if not result.success:
-        _raise_error_response(result.error_message or "Unknown error")
-
-    # Handle the case where player creation failed
-    if result.player_data is None:
-        _raise_server_error("Player creation failed")
-
-    # Convert DTO to HTTP response
-    return _convert_player_data_to_response(cast("PlayerData", result.player_data))
-
-
-def _convert_player_data_to_response(player_data: PlayerData) -> PlayerResponse:
-    """Convert PlayerData DTO to HTTP response"""
-    return PlayerResponse(
-        sid=player_data.sid,
-        name=player_data.name,
-        location={
-            "description": player_data.location.description,
-            "exits": player_data.location.exits,
-            "items": [
-                {"sid": item.sid, "name": item.name, "description": item.description}
-                for item in player_data.location.items
-            ],
-        },
-        bag={
-            "items": [
-                {"sid": item.sid, "name": item.name, "description": item.description}
-                for item in player_data.bag.items
-            ]
-        },
-    )
+        return MsgspecJSONResponse(
+            {"detail": result.error_message or "Unknown error"}, status_code=400
+        )
 
+    # The DTO is encoded as-is: no PlayerResponse copy and no response-model re-validation
+    return MsgspecJSONResponse(result.player_data, status_code=201)
 
-def get_start_game_command_handler() -> StartGameCommandHandler:
-    """Dependency injection for start game command handler"""
-    player_repo = InMemoryPlayerRepository()
-    world_repo = InMemoryWorldRepository()
-    return StartGameCommandHandler(player_repo, world_repo)
 
+async def _handle_unexpected_error(_request: Request, _exc: Exception) -> MsgspecJSONResponse:
+    """Translate unexpected failures into the API's JSON error shape
 
-async def start_game(
-    request: StartGameRequest,
-    command_handler: Annotated[StartGameCommandHandler, Depends(get_start_game_command_handler)],
-) -> PlayerResponse:
-    """Start a new game with a new player
-    Driving adapter - converts HTTP requests to domain commands
+    The exception text is not echoed back, so internals never leak to clients.
     """
-    try:
-        return _execute_start_game_command(command_handler, request)
-    except HTTPException:
-        raise
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e)) from e
-    except Exception as e:
-        error_detail = f"Internal server error: {e!s}"
-        raise HTTPException(status_code=500, detail=error_detail) from e
+    return MsgspecJSONResponse({"detail": "Internal server error"}, status_code=500)
 
 
 def create_app() -> FastAPI:
     """Create and configure FastAPI application
     This is a driving adapter that handles HTTP concerns
     """
-    app = FastAPI(title="Katacombs API", version="1.0.0")
-    _ = app.post("/game/player", status_code=201)(start_game)
+    app = FastAPI(
+        title="Katacombs API",
+        version="1.0.0",
+        default_response_class=MsgspecJSONResponse,
+    )
+    world_repo = InMemoryWorldRepository()
+    projection = InMemoryPlayerProjectionRepository(world_repo.get_world())
+    app.state.player_projection_repository = projection
+    app.state.start_game_command_handler = _create_start_game_command_handler(
+        world_repo, projection
+    )
+    app.add_exception_handler(Exception, _handle_unexpected_error)
+    # PlayerResponse only documents the payload; start_game returns an encoded response directly
+    _ = app.post("/game/player", status_code=201, response_model=PlayerResponse)(start_game)
     return app
@@ -12,62 +12,65 @@ from ...domain.world import World
 class InMemoryPlayerProjectionRepository(PlayerProjectionRepository):
     """In-memory projection repository for player queries
 
-    This implementation reads from the same data source as the write-side
-    repository but returns DTOs directly without loading full domain objects.
+    This implementation keeps a denormalized read model that is refreshed
+    by the write-side repository whenever a player is saved or deleted,
+    so queries return prebuilt DTOs without loading domain objects.
 
     In a production system, this could:
     - Read from a denormalized view/table
     - Use a separate read database
-    - Cache frequently accessed data
+    - Be updated from domain events
     """
 
-    def __init__(self, players: dict[Sid, Player], world: World):
-        """Initialize with access to player data and world
+    def __init__(self, world: World):
+        """Initialize with the world used to denormalize location data
 
         Args:
-            players: Dictionary of players (shared with write repository)
             world: World aggregate for location lookups
         """
-        self._players = players
         self._world = world
+        # Keyed by the raw SID string so reads never build or validate a Sid;
+        # only active players are listed, so listing never filters
+        self._active_list_items: dict[str, PlayerListItemDto] = {}
+        self._details: dict[str, PlayerDetailsDto] = {}
 
-    def find_all_active_players(self) -> list[PlayerListItemDto]:
-        """Get list of all active players with denormalized location data"""
-        result = []
-
-        for player in self._players.values():
-            if player.is_active:
-                # Fetch location description from World (denormalized for read)
-                location = self._world.get_location(player.location_sid)
-                location_description = location.description if location else "Unknown location"
-
-                result.append(
-                    PlayerListItemDto(
-                        sid=str(player.sid.value),
-                        name=player.name,
-                        location_description=location_description,
-                        is_active=player.is_active,
-                    )
-                )
-
-        return result
-
-    def get_player_details(self, player_sid: str) -> PlayerDetailsDto | None:
-        """Get detailed player information for display"""
-        # Find player by SID
-        player = self._players.get(Sid(player_sid))
-        if not player:
-            return None
-
-        # Fetch location description from World
+    def project(self, player: Player) -> None:
+        """Refresh the read model for a saved player"""
+        # Fetch location description from World (denormalized for read)
         location = self._world.get_location(player.location_sid)
         location_description = location.description if location else "Unknown location"
 
-        return PlayerDetailsDto(
-            sid=str(player.sid.value),
+        player_sid = player.sid.value
+        if player.is_active:
+            self._active_list_items[player_sid] = PlayerListItemDto(
+                sid=player_sid,
+                name=player.name,
+                location_description=location_description,
+                is_active=True,
+            )
+        else:
+            self._active_list_items.pop(player_sid, None)
+        self._details[player_sid] = PlayerDetailsDto(
+            sid=player_sid,
             name=player.name,
-            location_sid=str(player.location_sid.value),
+            location_sid=player.location_sid.value,
             location_description=location_description,
             bag_item_count=player.bag.item_count(),
             is_active=player.is_active,
         )
+
+    def remove(self, player_sid: Sid) -> None:
+        """Drop a deleted player from the read model"""
+        self._active_list_items.pop(player_sid.value, None)
+        self._details.pop(player_sid.value, None)
+
+    def find_all_active_players(self) -> list[PlayerListItemDto]:
+        """Get list of all active players with denormalized location data"""
+        return list(self._active_list_items.values())
+
+    def get_player_details(self, player_sid: str) -> PlayerDetailsDto | None:
+        """Get detailed player information for display
+
+        Unknown or malformed SIDs simply return None.
+        """
+        return self._details.get(player_sid)
@@ -1,4 +1,5 @@
 from ...domain.player import Player, PlayerRepository, Sid
+from .player_projector import PlayerProjector
 
 
 class InMemoryPlayerRepository(PlayerRepository):
@@ -9,32 +10,30 @@ class InMemoryPlayerRepository(PlayerRepository):
 
     IMPORTANT: This is the WRITE-SIDE repository.
     For queries, use InMemoryPlayerProjectionRepository instead.
+    Writes are forwarded to an optional PlayerProjector so a read model stays current.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, projector: PlayerProjector | None = None) -> None:
         super().__init__()
-        self._players: dict[Sid, Player] = {}
+        # Keyed by the raw SID string so lookups hash a str in C, not a Sid
+        self._players: dict[str, Player] = {}
+        self._projector = projector
 
     def save(self, player: Player) -> None:
         """Save player to in-memory storage"""
-        self._players[player.sid] = player
+        self._players[player.sid.value] = player
+        if self._projector is not None:
+            self._projector.project(player)
 
     def find_by_sid(self, player_sid: Sid) -> Player | None:
         """Find player by SID for command operations"""
-        return self._players.get(player_sid)
+        return self._players.get(player_sid.value)
 
     def delete(self, player_sid: Sid) -> bool:
         """Delete player by SID"""
-        if player_sid in self._players:
-            del self._players[player_sid]
+        if player_sid.value in self._players:
+            del self._players[player_sid.value]
+            if self._projector is not None:
+                self._projector.remove(player_sid)
             return True
         return False
-
-    def get_players_dict(self) -> dict[Sid, Player]:
-        """Get internal players dictionary for projection repository
-
-        This is a temporary helper method to allow the projection repository
-        to access the same data. In a real system, they might use separate
-        databases or the projection repo would be updated via events.
-        """
-        return self._players
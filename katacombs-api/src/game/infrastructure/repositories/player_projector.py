@@ -0,0 +1,19 @@
+from typing import Protocol
+
+from ...domain.player import Player, Sid
+
+
+class PlayerProjector(Protocol):
+    """Read model the write-side player repository keeps current
+
+    Lets the write side notify any projection without depending on a
+    concrete read-side implementation.
+    """
+
+    def project(self, player: Player) -> None:
+        """Refresh the read model for a saved player"""
+        ...
+
+    def remove(self, player_sid: Sid) -> None:
+        """Drop a deleted player from the read model"""
+        ...
@@ -0,0 +1,48 @@
+from collections.abc import Callable, Iterator
+from itertools import count
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.game.domain.player import Bag, Player, Sid
+from src.game.infrastructure.adapters.fastapi_app import create_app
+
+
+@pytest.fixture
+def sid_factory() -> Callable[[], Sid]:
+    """Deterministic SIDs that are distinct within a test
+
+    Most tests only need unique identifiers, so a counter replaces
+    drawing fresh random numbers for every SID.
+    """
+    counter = count(1)
+    return lambda: Sid(f"000000-000000000000-{next(counter):08d}")
+
+
+@pytest.fixture
+def make_player(sid_factory: Callable[[], Sid]) -> Callable[..., Player]:
+    """Create a new player with an empty bag, at a fresh location unless one is given"""
+
+    def _make_player(name: str = "Pedro", location_sid: Sid | None = None) -> Player:
+        return Player.create(sid_factory(), name, location_sid or sid_factory(), Bag())
+
+    return _make_player
+
+
+@pytest.fixture(scope="session")
+def app() -> FastAPI:
+    """One FastAPI app for the whole test session
+
+    Routes and the OpenAPI schema are built once. Players started by different
+    tests share the app's in-memory repositories, so tests must not assume an
+    empty player store.
+    """
+    return create_app()
+
+
+@pytest.fixture(scope="session")
+def client(app: FastAPI) -> Iterator[TestClient]:
+    """One TestClient over the session app for the end-to-end tests"""
+    with TestClient(app) as test_client:
+        yield test_client
@@ -1,6 +1,9 @@
-from fastapi.testclient import TestClient
+import asyncio
 
-from src.game.infrastructure.adapters.fastapi_app import create_app
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 
 
 class TestStartGameE2E:
@@ -9,11 +12,7 @@ class TestStartGameE2E:
     Tests the complete system behavior from HTTP request to final response
     """
 
-    def test_complete_user_registration_journey_e2e(self):
-        # Arrange - Real HTTP server with real dependencies
-        app = create_app()
-        client = TestClient(app)
-
+    def test_complete_user_registration_journey_e2e(self, client: TestClient):
         # Act - Real HTTP call to real server (external system provides SID)
         response = client.post(
             "/game/player",
@@ -49,18 +48,18 @@ class TestStartGameE2E:
         assert isinstance(bag["items"], list)
         assert len(bag["items"]) == 0  # Should start with empty bag
 
-    def test_multiple_players_can_start_games_independently_e2e(self):
-        # Arrange - Real application
-        app = create_app()
-        client = TestClient(app)
-
-        # Act - Create two different players (each with unique SID from external system)
-        response1 = client.post(
-            "/game/player", json={"name": "Alice", "sid": "111111-111111111111-11111111"}
-        )
-        response2 = client.post(
-            "/game/player", json={"name": "Bob", "sid": "222222-222222222222-22222222"}
-        )
+    @pytest.mark.asyncio
+    async def test_multiple_players_can_start_games_independently_e2e(self, app: FastAPI):
+        # Act - Create two different players concurrently (each with a SID from the external system)
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response1, response2 = await asyncio.gather(
+                client.post(
+                    "/game/player", json={"name": "Alice", "sid": "111111-111111111111-11111111"}
+                ),
+                client.post(
+                    "/game/player", json={"name": "Bob", "sid": "222222-222222222222-22222222"}
+                ),
+            )
 
         # Assert - Both players created successfully with different SIDs
         assert response1.status_code == 201
@@ -77,18 +76,21 @@ class TestStartGameE2E:
         # Both should start in the same location (same description)
         assert player1_data["location"]["description"] == player2_data["location"]["description"]
 
-    def test_error_handling_works_end_to_end(self):
-        # Arrange
-        app = create_app()
-        client = TestClient(app)
-
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            pytest.param({"name": "", "sid": "123456-123456789012-12345678"}, id="empty_name"),
+            pytest.param({"name": "   ", "sid": "123456-123456789012-12345678"}, id="blank_name"),
+            pytest.param({"name": "Pedro", "sid": "invalid-sid-format"}, id="invalid_sid"),
+        ],
+    )
+    def test_error_handling_works_end_to_end(self, client: TestClient, payload: dict[str, str]):
         # Act - Try to create player with invalid data
         response = client.post(
-            "/game/player",
-            json={"name": "", "sid": "123456-123456789012-12345678"},
-            headers={"Content-Type": "application/json"},
+            "/game/player", json=payload, headers={"Content-Type": "application/json"}
         )
 
         # Assert - Error handled properly through entire stack
         assert response.status_code == 400
-        assert "error" in response.json() or "detail" in response.json()
+        error_data = response.json()
+        assert "error" in error_data or "detail" in error_data
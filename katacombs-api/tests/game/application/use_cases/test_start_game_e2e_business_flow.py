@@ -1,7 +1,5 @@
 from fastapi.testclient import TestClient
 
-from src.game.infrastructure.adapters.fastapi_app import create_app
-
 
 class TestStartGameE2EBusinessFlow:
     """E2E BUSINESS FLOW TEST: Complete Start Game User Journey
@@ -18,11 +16,7 @@ class TestStartGameE2EBusinessFlow:
     Tests the system from HTTP layer to infrastructure layer.
     """
 
-    def test_complete_start_game_business_flow(self):
-        # Arrange - Real HTTP client with real app
-        app = create_app()
-        client = TestClient(app)
-
+    def test_complete_start_game_business_flow(self, client: TestClient):
         # ACT & ASSERT - Complete Business Flow
 
         # STEP 1: Player starts a new game (external system provides SID)
@@ -57,11 +51,9 @@ class TestStartGameE2EBusinessFlow:
         assert len(location_data["items"]) > 0  # Should have starting items like torch
 
         # Find the torch item for later reference
-        torch_item = None
-        for item in location_data["items"]:
-            if item["name"] == "Torch":
-                torch_item = item
-                break
+        torch_item = next(
+            (item for item in location_data["items"] if item["name"] == "Torch"), None
+        )
         assert torch_item is not None, "Starting location should have a torch"
         assert "description" in torch_item
         assert len(torch_item["description"]) > 0
@@ -1,36 +1,39 @@
 from unittest.mock import Mock
 
-from src.game.application.commands import (
-    StartGameCommand,
-    StartGameCommandHandler,
-    StartGameResponse,
-)
-from src.game.domain.player import PlayerRepository, Sid
-from src.game.domain.world import Location, WorldRepository
+import pytest
+
+from src.game.application.commands import StartGameCommand, StartGameCommandHandler
+from src.game.domain.player import PlayerRepository
+from src.game.domain.world import Action, Item, Location, World, WorldRepository
 from src.game.infrastructure.sid_generator import SidGenerator
 
 
+@pytest.fixture(scope="module")
+def seeded_world() -> World:
+    """One starting location; shared only by tests that never mutate the world"""
+    starting_location = Location(
+        sid=SidGenerator.generate(), description="Starting location for the game"
+    )
+    return World(
+        locations={starting_location.sid: starting_location},
+        starting_location_sid=starting_location.sid,
+    )
+
+
 class TestStartGameCommandHandler:
     """UNIT TEST: Use Case orchestration logic
     This test should fail until we implement the use case orchestration
     """
 
-    def test_command_handler_orchestrates_player_creation_and_starting_location(self):
+    def test_command_handler_orchestrates_player_creation_and_starting_location(
+        self, seeded_world: World
+    ):
         # Arrange - Mock ONLY the driven ports (adapters), NOT domain entities
         mock_player_repo = Mock(spec=PlayerRepository)
         mock_world_repo = Mock(spec=WorldRepository)
 
-        # Use REAL domain entities - never mock domain objects
-        from src.game.domain.world import World
-        real_starting_location = Location(
-            sid=SidGenerator.generate(), description="Starting location for the game"
-        )
-        # Create a real World aggregate with the test location
-        real_world = World(
-            locations={real_starting_location.sid: real_starting_location},
-            starting_location_sid=real_starting_location.sid
-        )
-        mock_world_repo.get_world.return_value = real_world
+        # Use a REAL World aggregate - never mock domain objects
+        mock_world_repo.get_world.return_value = seeded_world
 
         command_handler = StartGameCommandHandler(mock_player_repo, mock_world_repo)
         command = StartGameCommand(player_name="Pedro", player_sid="123456-123456789012-12345678")
@@ -39,7 +42,6 @@ class TestStartGameCommandHandler:
         result = command_handler.execute(command)
 
         # Assert - Verify orchestration logic only (no business logic)
-        assert isinstance(result, StartGameResponse)
         assert result.success is True
 
         # Verify the command handler called the right repositories (adapters)
@@ -47,5 +49,66 @@ class TestStartGameCommandHandler:
         mock_player_repo.save.assert_called_once()  # ✅ Command - causes state change
         # Do NOT verify: mock_world_repo.find_starting_location.assert_called_once()  # ❌ Query - implementation detail
 
+    def test_command_handler_rejects_invalid_sid_without_saving(self):
+        # Arrange
+        mock_player_repo = Mock(spec=PlayerRepository)
+        mock_world_repo = Mock(spec=WorldRepository)
+        command_handler = StartGameCommandHandler(mock_player_repo, mock_world_repo)
+        command = StartGameCommand(player_name="Pedro", player_sid="invalid-sid")
+
+        # Act
+        result = command_handler.execute(command)
+
+        # Assert
+        assert result.success is False
+        assert result.error_message == "Invalid Sid format: invalid-sid"
+        mock_player_repo.save.assert_not_called()
+
+    def test_command_handler_reports_items_added_between_starts(self):
+        # Arrange
+        mock_player_repo = Mock(spec=PlayerRepository)
+        mock_world_repo = Mock(spec=WorldRepository)
+        starting_location = Location(sid=SidGenerator.generate(), description="Entrance")
+        mock_world_repo.get_world.return_value = World(
+            locations={starting_location.sid: starting_location},
+            starting_location_sid=starting_location.sid,
+        )
+        command_handler = StartGameCommandHandler(mock_player_repo, mock_world_repo)
+        first = command_handler.execute(StartGameCommand("Pedro", SidGenerator.generate().value))
+
+        # Act
+        starting_location.add_item(
+            Item(SidGenerator.generate(), "Torch", "A burning torch", [Action.PICK])
+        )
+        second = command_handler.execute(StartGameCommand("Rui", SidGenerator.generate().value))
+
+        # Assert
+        assert first.player_data is not None
+        assert second.player_data is not None
+        assert first.player_data.location.items == ()
+        assert [item.name for item in second.player_data.location.items] == ["Torch"]
+
+    def test_command_handler_reports_current_item_details(self):
+        # Arrange
+        mock_player_repo = Mock(spec=PlayerRepository)
+        mock_world_repo = Mock(spec=WorldRepository)
+        starting_location = Location(sid=SidGenerator.generate(), description="Entrance")
+        torch = Item(SidGenerator.generate(), "Torch", "A lit torch", [Action.PICK])
+        starting_location.add_item(torch)
+        mock_world_repo.get_world.return_value = World(
+            locations={starting_location.sid: starting_location},
+            starting_location_sid=starting_location.sid,
+        )
+        command_handler = StartGameCommandHandler(mock_player_repo, mock_world_repo)
+        command_handler.execute(StartGameCommand("Pedro", SidGenerator.generate().value))
+
+        # Act
+        torch.description = "A burnt out torch"
+        result = command_handler.execute(StartGameCommand("Ana", SidGenerator.generate().value))
+
+        # Assert
+        assert result.player_data is not None
+        assert result.player_data.location.items[0].description == "A burnt out torch"
+
 
 # This unit test verifies command handler orchestration logic
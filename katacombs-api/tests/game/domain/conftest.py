@@ -0,0 +1,42 @@
+from collections.abc import Callable
+
+import pytest
+
+from src.game.domain.player import Bag, Sid
+from src.game.domain.world import Action, Item, Location
+
+
+@pytest.fixture
+def empty_bag() -> Bag:
+    """A fresh Bag per test; players own and mutate their bag, so it is never shared"""
+    return Bag()
+
+
+@pytest.fixture
+def make_item(sid_factory: Callable[[], Sid]) -> Callable[..., Item]:
+    """Build an Item, defaulting every field the test does not care about"""
+
+    def _make_item(
+        name: str = "Sword",
+        description: str = "A sharp blade",
+        actions: list[Action] | None = None,
+        sid: Sid | None = None,
+    ) -> Item:
+        return Item(
+            sid or sid_factory(),
+            name,
+            description,
+            actions if actions is not None else [Action.PICK],
+        )
+
+    return _make_item
+
+
+@pytest.fixture
+def make_location(sid_factory: Callable[[], Sid]) -> Callable[..., Location]:
+    """Build a Location with a fresh SID and a default description"""
+
+    def _make_location(description: str = "A quiet room", sid: Sid | None = None) -> Location:
+        return Location(sid or sid_factory(), description)
+
+    return _make_location
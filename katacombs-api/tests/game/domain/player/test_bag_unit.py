@@ -0,0 +1,96 @@
+from collections.abc import Callable
+
+from src.game.domain.player import Bag, Sid
+
+
+class TestBag:
+    """UNIT TEST: Bag Value Object Domain Behavior
+    Tests adding, removing and querying items held by a player
+    """
+
+    def test_new_bag_is_empty(self):
+        # Act
+        bag = Bag()
+
+        # Assert
+        assert bag.is_empty()
+        assert bag.item_count() == 0
+
+    def test_add_item_keeps_insertion_order(self, sid_factory: Callable[[], Sid]):
+        # Arrange
+        bag = Bag()
+        first_sid = sid_factory()
+        second_sid = sid_factory()
+
+        # Act
+        bag.add_item(first_sid)
+        bag.add_item(second_sid)
+
+        # Assert
+        assert list(bag) == [first_sid, second_sid]
+        assert bag.has_item(first_sid)
+        assert bag.item_count() == 2
+
+    def test_remove_item_removes_only_that_item(self, sid_factory: Callable[[], Sid]):
+        # Arrange
+        bag = Bag()
+        kept_sid = sid_factory()
+        removed_sid = sid_factory()
+        bag.add_item(kept_sid)
+        bag.add_item(removed_sid)
+
+        # Act
+        result = bag.remove_item(removed_sid)
+
+        # Assert
+        assert result is True
+        assert not bag.has_item(removed_sid)
+        assert list(bag) == [kept_sid]
+
+    def test_remove_missing_item_returns_false(self, sid_factory: Callable[[], Sid]):
+        # Arrange
+        bag = Bag()
+
+        # Act
+        result = bag.remove_item(sid_factory())
+
+        # Assert
+        assert result is False
+
+    def test_adding_same_item_twice_keeps_one_copy(self, sid_factory: Callable[[], Sid]):
+        # Arrange
+        bag = Bag()
+        item_sid = sid_factory()
+
+        # Act
+        bag.add_item(item_sid)
+        bag.add_item(item_sid)
+
+        # Assert
+        assert bag.item_count() == 1
+        assert bag.item_sids == [item_sid]
+
+    def test_bags_with_same_items_in_different_order_are_equal(
+        self, sid_factory: Callable[[], Sid]
+    ):
+        # Arrange
+        first_sid = sid_factory()
+        second_sid = sid_factory()
+
+        # Act
+        bag = Bag([first_sid, second_sid])
+        reordered_bag = Bag([second_sid, first_sid])
+
+        # Assert
+        assert bag == reordered_bag
+        assert bag.item_sids == [first_sid, second_sid]
+
+    def test_item_sids_is_a_copy_of_the_contents(self, sid_factory: Callable[[], Sid]):
+        # Arrange
+        bag = Bag([sid_factory()])
+
+        # Act
+        bag.item_sids.clear()
+
+        # Assert
+        assert bag.item_count() == 1
@@ -1,7 +1,8 @@
+from collections.abc import Callable
+
 import pytest
 
 from src.game.domain.player import Bag, Player, Sid
-from src.game.infrastructure.sid_generator import SidGenerator
 
 
 class TestPlayer:
@@ -9,40 +10,40 @@ class TestPlayer:
     Test domain logic for Player aggregate
     """
 
-    def test_player_can_be_created_with_valid_data(self):
-        player_sid = SidGenerator.generate()
+    def test_player_can_be_created_with_valid_data(
+        self, sid_factory: Callable[[], Sid], empty_bag: Bag
+    ):
+        player_sid = sid_factory()
         name = "Pedro"
-        location_sid = SidGenerator.generate()
-        bag = Bag()
+        location_sid = sid_factory()
 
-        player = Player.create(player_sid, name, location_sid, bag)
+        player = Player.create(player_sid, name, location_sid, empty_bag)
 
         assert player.sid == player_sid
         assert player.name == name
         assert player.location_sid == location_sid
-        assert player.bag == bag
+        assert player.bag is empty_bag
         assert player.is_active is True
 
-    def test_player_name_cannot_be_empty(self):
-        player_sid = SidGenerator.generate()
-        location_sid = SidGenerator.generate()
-        bag = Bag()
+    def test_player_name_cannot_be_empty(self, sid_factory: Callable[[], Sid], empty_bag: Bag):
+        player_sid = sid_factory()
+        location_sid = sid_factory()
 
         with pytest.raises(ValueError, match="Player name cannot be empty"):
-            Player.create(player_sid, "", location_sid, bag)
+            Player.create(player_sid, "", location_sid, empty_bag)
 
-    def test_player_can_move_to_new_location(self):
-        player_sid = SidGenerator.generate()
-        original_location_sid = SidGenerator.generate()
-        new_location_sid = SidGenerator.generate()
-        player = Player.create(player_sid, "Pedro", original_location_sid, Bag())
+    def test_player_can_move_to_new_location(
+        self, sid_factory: Callable[[], Sid], make_player: Callable[..., Player]
+    ):
+        player = make_player()
+        new_location_sid = sid_factory()
 
         player.move_to_location(new_location_sid)
 
         assert player.location_sid == new_location_sid
 
-    def test_player_can_quit_game(self):
-        player = Player.create(SidGenerator.generate(), "Pedro", SidGenerator.generate(), Bag())
+    def test_player_can_quit_game(self, make_player: Callable[..., Player]):
+        player = make_player()
 
         player.quit_game()
 
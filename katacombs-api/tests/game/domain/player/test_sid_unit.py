@@ -0,0 +1,92 @@
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from src.game.domain.player import Sid
+
+
+class TestSid:
+    """UNIT TEST: Sid Value Object Domain Behavior
+    Tests the Sid format validation rules
+    """
+
+    def test_sid_can_be_created_with_valid_format(self):
+        # Arrange
+        value = "123456-123456789012-12345678"
+
+        # Act
+        sid = Sid(value)
+
+        # Assert
+        assert sid.value == value
+        assert str(sid) == value
+
+    @pytest.mark.parametrize(
+        "invalid_value",
+        [
+            "",
+            "invalid-sid-format",
+            "12345-123456789012-12345678",
+            "123456-12345678901-12345678",
+            "123456-123456789012-1234567",
+            "123456-123456789012-123456789",
+            "123456_123456789012_12345678",
+            "abcdef-123456789012-12345678",
+            "123456-123456789012-12345678\n",
+        ],
+    )
+    def test_sid_cannot_be_created_with_invalid_format(self, invalid_value: str):
+        # Act & Assert
+        with pytest.raises(ValueError, match="Invalid Sid format"):
+            Sid(invalid_value)
+
+    def test_sids_with_same_value_are_equal(self):
+        # Arrange
+        sid1 = Sid("123456-123456789012-12345678")
+        sid2 = Sid("123456-123456789012-12345678")
+
+        # Act & Assert
+        assert sid1 == sid2
+        assert hash(sid1) == hash(sid2)
+
+    def test_sid_is_not_equal_to_its_raw_string(self):
+        # Arrange
+        value = "123456-123456789012-12345678"
+
+        # Act
+        sid = Sid(value)
+
+        # Assert
+        assert sid != value
+        assert sid != Sid("654321-123456789012-12345678")
+
+    def test_sid_can_be_used_as_dict_key(self):
+        # Arrange
+        players = {Sid("123456-123456789012-12345678"): "Pedro"}
+
+        # Act
+        result = players.get(Sid("123456-123456789012-12345678"))
+
+        # Assert
+        assert result == "Pedro"
+
+    def test_sid_is_slotted_and_immutable(self):
+        # Arrange
+        sid = Sid("123456-123456789012-12345678")
+
+        # Act & Assert
+        assert not hasattr(sid, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            sid.value = "654321-123456789012-12345678"  # type: ignore[misc]
+
+    def test_unchecked_sid_equals_validated_sid(self):
+        # Arrange
+        value = "123456-123456789012-12345678"
+
+        # Act
+        sid = Sid.unchecked(value)
+
+        # Assert
+        assert sid == Sid(value)
+        assert hash(sid) == hash(Sid(value))
+        assert str(sid) == value
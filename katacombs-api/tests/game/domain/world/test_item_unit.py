@@ -1,8 +1,9 @@
+from collections.abc import Callable
+
 import pytest
 
 from src.game.domain.player import Sid
 from src.game.domain.world import Action, Item
-from src.game.infrastructure.sid_generator import SidGenerator
 
 
 class TestItem:
@@ -10,9 +11,9 @@ class TestItem:
     Tests the Item entity business logic and validation rules
     """
 
-    def test_item_can_be_created_with_valid_data(self):
+    def test_item_can_be_created_with_valid_data(self, sid_factory: Callable[[], Sid]):
         # Arrange
-        item_sid = SidGenerator.generate()
+        item_sid = sid_factory()
         name = "Magic Sword"
         description = "A legendary sword with mystical powers"
         actions = [Action.PICK, Action.USE]
@@ -26,9 +27,9 @@ class TestItem:
         assert item.description == description
         assert item.available_actions == actions
 
-    def test_item_can_be_created_without_actions(self):
+    def test_item_can_be_created_without_actions(self, sid_factory: Callable[[], Sid]):
         # Arrange
-        item_sid = SidGenerator.generate()
+        item_sid = sid_factory()
         name = "Decorative Vase"
         description = "A beautiful but fragile vase"
 
@@ -41,49 +42,29 @@ class TestItem:
         assert item.description == description
         assert item.available_actions == []  # Default empty list
 
-    def test_item_cannot_be_created_with_empty_name(self):
-        # Arrange
-        item_sid = SidGenerator.generate()
-        empty_name = ""
-        description = "Some description"
-
-        # Act & Assert
-        with pytest.raises(ValueError, match="Item name cannot be empty"):
-            Item(item_sid, empty_name, description)
-
-    def test_item_cannot_be_created_with_whitespace_only_name(self):
-        # Arrange
-        item_sid = SidGenerator.generate()
-        whitespace_name = "   \t\n   "
-        description = "Some description"
-
-        # Act & Assert
-        with pytest.raises(ValueError, match="Item name cannot be empty"):
-            Item(item_sid, whitespace_name, description)
-
-    def test_item_cannot_be_created_with_empty_description(self):
-        # Arrange
-        item_sid = SidGenerator.generate()
-        name = "Magic Ring"
-        empty_description = ""
-
-        # Act & Assert
-        with pytest.raises(ValueError, match="Item description cannot be empty"):
-            Item(item_sid, name, empty_description)
-
-    def test_item_cannot_be_created_with_whitespace_only_description(self):
-        # Arrange
-        item_sid = SidGenerator.generate()
-        name = "Magic Ring"
-        whitespace_description = "   \t\n   "
-
+    @pytest.mark.parametrize(
+        ("name", "description", "error"),
+        [
+            pytest.param("", "Some description", "Item name cannot be empty", id="empty_name"),
+            pytest.param(
+                "   \t\n   ", "Some description", "Item name cannot be empty", id="blank_name"
+            ),
+            pytest.param("Magic Ring", "", "Item description cannot be empty", id="empty_desc"),
+            pytest.param(
+                "Magic Ring", "   \t\n   ", "Item description cannot be empty", id="blank_desc"
+            ),
+        ],
+    )
+    def test_item_cannot_be_created_with_empty_name_or_description(
+        self, sid_factory: Callable[[], Sid], name: str, description: str, error: str
+    ):
         # Act & Assert
-        with pytest.raises(ValueError, match="Item description cannot be empty"):
-            Item(item_sid, name, whitespace_description)
+        with pytest.raises(ValueError, match=error):
+            Item(sid_factory(), name, description)
 
-    def test_item_with_single_action(self):
+    def test_item_with_single_action(self, sid_factory: Callable[[], Sid]):
         # Arrange
-        item_sid = SidGenerator.generate()
+        item_sid = sid_factory()
         name = "Health Potion"
         description = "A potion that restores health when consumed"
         actions = [Action.USE]
@@ -96,9 +77,9 @@ class TestItem:
         assert Action.USE in item.available_actions
         assert Action.PICK not in item.available_actions
 
-    def test_item_with_multiple_actions(self):
+    def test_item_with_multiple_actions(self, sid_factory: Callable[[], Sid]):
         # Arrange
-        item_sid = SidGenerator.generate()
+        item_sid = sid_factory()
         name = "Torch"
         description = "A burning torch that provides light"
         actions = [Action.PICK, Action.USE]
@@ -111,9 +92,9 @@ class TestItem:
         assert Action.PICK in item.available_actions
         assert Action.USE in item.available_actions
 
-    def test_item_actions_can_contain_duplicates(self):
+    def test_item_actions_can_contain_duplicates(self, sid_factory: Callable[[], Sid]):
         # Arrange
-        item_sid = SidGenerator.generate()
+        item_sid = sid_factory()
         name = "Strange Artifact"
         description = "An artifact with mysterious properties"
         actions = [Action.USE, Action.USE, Action.PICK]  # Duplicate USE actions
@@ -125,9 +106,11 @@ class TestItem:
         assert item.available_actions == [Action.USE, Action.USE, Action.PICK]
         assert len(item.available_actions) == 3  # Duplicates preserved
 
-    def test_item_with_valid_name_containing_spaces_and_special_chars(self):
+    def test_item_with_valid_name_containing_spaces_and_special_chars(
+        self, sid_factory: Callable[[], Sid]
+    ):
         # Arrange
-        item_sid = SidGenerator.generate()
+        item_sid = sid_factory()
         name = "Ancient Key of Wisdom"
         description = "A key with intricate engravings"
 
@@ -137,9 +120,9 @@ class TestItem:
         # Assert
         assert item.name == "Ancient Key of Wisdom"
 
-    def test_item_with_multiline_description(self):
+    def test_item_with_multiline_description(self, sid_factory: Callable[[], Sid]):
         # Arrange
-        item_sid = SidGenerator.generate()
+        item_sid = sid_factory()
         name = "Spellbook"
         description = "A thick book containing ancient spells.\nIts pages glow with magical energy."
 
@@ -149,19 +132,21 @@ class TestItem:
         # Assert
         assert item.description == "A thick book containing ancient spells.\nIts pages glow with magical energy."
 
-    def test_items_are_equal_with_same_sid(self):
+    def test_items_are_equal_with_same_sid(
+        self, sid_factory: Callable[[], Sid], make_item: Callable[..., Item]
+    ):
         # Arrange
-        item_sid = SidGenerator.generate()
-        item1 = Item(item_sid, "Sword", "A sharp blade", [Action.PICK])
-        item2 = Item(item_sid, "Sword", "A sharp blade", [Action.PICK])
+        item_sid = sid_factory()
+        item1 = make_item(sid=item_sid)
+        item2 = make_item(sid=item_sid)
 
         # Act & Assert
         assert item1 == item2  # Same SID means same item
 
-    def test_items_are_different_with_different_sid(self):
+    def test_items_are_different_with_different_sid(self, make_item: Callable[..., Item]):
         # Arrange
-        item1 = Item(SidGenerator.generate(), "Sword", "A sharp blade", [Action.PICK])
-        item2 = Item(SidGenerator.generate(), "Sword", "A sharp blade", [Action.PICK])
+        item1 = make_item()
+        item2 = make_item()
 
         # Act & Assert
         assert item1 != item2  # Different SIDs mean different items
\ No newline at end of file
@@ -1,8 +1,9 @@
+from collections.abc import Callable
+
 import pytest
 
 from src.game.domain.player import Sid
 from src.game.domain.world import Action, Direction, Item, Location
-from src.game.infrastructure.sid_generator import SidGenerator
 
 
 class TestLocation:
@@ -10,9 +11,9 @@ class TestLocation:
     Tests the Location entity business logic and validation rules
     """
 
-    def test_location_can_be_created_with_valid_data(self):
+    def test_location_can_be_created_with_valid_data(self, sid_factory: Callable[[], Sid]):
         # Arrange
-        location_sid = SidGenerator.generate()
+        location_sid = sid_factory()
         description = "A mysterious chamber"
 
         # Act
@@ -24,29 +25,23 @@ class TestLocation:
         assert location.exits == {}
         assert location.items == []
 
-    def test_location_cannot_be_created_with_empty_description(self):
-        # Arrange
-        location_sid = SidGenerator.generate()
-        empty_description = ""
-
+    @pytest.mark.parametrize(
+        "description",
+        [pytest.param("", id="empty"), pytest.param("   \t\n   ", id="whitespace_only")],
+    )
+    def test_location_cannot_be_created_with_blank_description(
+        self, sid_factory: Callable[[], Sid], description: str
+    ):
         # Act & Assert
         with pytest.raises(ValueError, match="Location description cannot be empty"):
-            Location(location_sid, empty_description)
+            Location(sid_factory(), description)
 
-    def test_location_cannot_be_created_with_whitespace_only_description(self):
+    def test_add_exit_creates_connection_to_destination(
+        self, sid_factory: Callable[[], Sid], make_location: Callable[..., Location]
+    ):
         # Arrange
-        location_sid = SidGenerator.generate()
-        whitespace_description = "   \t\n   "
-
-        # Act & Assert
-        with pytest.raises(ValueError, match="Location description cannot be empty"):
-            Location(location_sid, whitespace_description)
-
-    def test_add_exit_creates_connection_to_destination(self):
-        # Arrange
-        location_sid = SidGenerator.generate()
-        destination_sid = SidGenerator.generate()
-        location = Location(location_sid, "Starting room")
+        destination_sid = sid_factory()
+        location = make_location("Starting room")
 
         # Act
         location.add_exit(Direction.NORTH, destination_sid)
@@ -54,10 +49,11 @@ class TestLocation:
         # Assert
         assert location.exits[Direction.NORTH] == destination_sid
 
-    def test_add_exit_can_create_exit_without_destination(self):
+    def test_add_exit_can_create_exit_without_destination(
+        self, make_location: Callable[..., Location]
+    ):
         # Arrange
-        location_sid = SidGenerator.generate()
-        location = Location(location_sid, "Room with blocked exit")
+        location = make_location("Room with blocked exit")
 
         # Act
         location.add_exit(Direction.SOUTH, None)
@@ -65,16 +61,28 @@ class TestLocation:
         # Assert
         assert location.exits[Direction.SOUTH] is None
 
-    def test_get_available_directions_returns_only_connected_exits(self):
+    def test_exits_cannot_be_changed_without_add_exit(
+        self, sid_factory: Callable[[], Sid], make_location: Callable[..., Location]
+    ):
         # Arrange
-        location_sid = SidGenerator.generate()
-        destination_sid = SidGenerator.generate()
-        location = Location(location_sid, "Hub room")
+        location = make_location("Sealed room")
+
+        # Act & Assert - Direct writes would bypass the cached available directions
+        with pytest.raises(TypeError):
+            location.exits[Direction.NORTH] = sid_factory()  # type: ignore[index]
+        assert location.get_available_directions() == ()
+
+    def test_get_available_directions_returns_only_connected_exits(
+        self, sid_factory: Callable[[], Sid], make_location: Callable[..., Location]
+    ):
+        # Arrange
+        destination_sid = sid_factory()
+        location = make_location("Hub room")
 
         # Add some exits
         location.add_exit(Direction.NORTH, destination_sid)  # Connected
         location.add_exit(Direction.SOUTH, None)  # Blocked/unconnected
-        location.add_exit(Direction.EAST, SidGenerator.generate())  # Connected
+        location.add_exit(Direction.EAST, sid_factory())  # Connected
 
         # Act
         available_directions = location.get_available_directions()
@@ -85,24 +93,40 @@ class TestLocation:
         assert Direction.SOUTH not in available_directions  # None destination excluded
         assert len(available_directions) == 2
 
-    def test_get_available_directions_returns_empty_list_when_no_exits(self):
+    def test_get_available_directions_returns_empty_tuple_when_no_exits(
+        self, make_location: Callable[..., Location]
+    ):
         # Arrange
-        location_sid = SidGenerator.generate()
-        location = Location(location_sid, "Isolated room")
+        location = make_location("Isolated room")
 
         # Act
         available_directions = location.get_available_directions()
 
         # Assert
-        assert available_directions == []
+        assert available_directions == ()
+
+    def test_get_available_direction_values_is_refreshed_after_add_exit(
+        self, sid_factory: Callable[[], Sid], make_location: Callable[..., Location]
+    ):
+        # Arrange
+        location = make_location("Hub room")
+        location.add_exit(Direction.NORTH, sid_factory())
+        cached_values = location.get_available_direction_values()
+
+        # Act
+        location.add_exit(Direction.EAST, sid_factory())
+
+        # Assert
+        assert cached_values == ("north",)
+        assert location.get_available_direction_values() == ("north", "east")
 
-    def test_add_item_adds_item_to_location(self):
+    def test_add_item_adds_item_to_location(
+        self, make_item: Callable[..., Item], make_location: Callable[..., Location]
+    ):
         # Arrange
-        location_sid = SidGenerator.generate()
-        location = Location(location_sid, "Treasure room")
+        location = make_location("Treasure room")
 
-        item_sid = SidGenerator.generate()
-        item = Item(item_sid, "Golden key", "A shiny golden key", [Action.PICK])
+        item = make_item("Golden key", "A shiny golden key", [Action.PICK])
 
         # Act
         location.add_item(item)
@@ -111,14 +135,15 @@ class TestLocation:
         assert item in location.items
         assert len(location.items) == 1
 
-    def test_add_multiple_items_maintains_order(self):
+    def test_add_multiple_items_maintains_order(
+        self, make_item: Callable[..., Item], make_location: Callable[..., Location]
+    ):
         # Arrange
-        location_sid = SidGenerator.generate()
-        location = Location(location_sid, "Storage room")
+        location = make_location("Storage room")
 
-        item1 = Item(SidGenerator.generate(), "Sword", "A sharp sword", [Action.PICK])
-        item2 = Item(SidGenerator.generate(), "Shield", "A sturdy shield", [Action.PICK])
-        item3 = Item(SidGenerator.generate(), "Potion", "A healing potion", [Action.USE])
+        item1 = make_item("Sword", "A sharp sword", [Action.PICK])
+        item2 = make_item("Shield", "A sturdy shield", [Action.PICK])
+        item3 = make_item("Potion", "A healing potion", [Action.USE])
 
         # Act
         location.add_item(item1)
@@ -129,15 +154,19 @@ class TestLocation:
         assert location.items == [item1, item2, item3]
         assert len(location.items) == 3
 
-    def test_location_with_multiple_exits_and_items(self):
+    def test_location_with_multiple_exits_and_items(
+        self,
+        sid_factory: Callable[[], Sid],
+        make_item: Callable[..., Item],
+        make_location: Callable[..., Location],
+    ):
         # Arrange
-        location_sid = SidGenerator.generate()
-        location = Location(location_sid, "Central chamber")
+        location = make_location("Central chamber")
 
         # Add exits in all directions
-        north_sid = SidGenerator.generate()
-        south_sid = SidGenerator.generate()
-        east_sid = SidGenerator.generate()
+        north_sid = sid_factory()
+        south_sid = sid_factory()
+        east_sid = sid_factory()
 
         location.add_exit(Direction.NORTH, north_sid)
         location.add_exit(Direction.SOUTH, south_sid)
@@ -145,8 +174,8 @@ class TestLocation:
         location.add_exit(Direction.WEST, None)  # Blocked exit
 
         # Add items
-        torch = Item(SidGenerator.generate(), "Torch", "A burning torch", [Action.PICK, Action.USE])
-        key = Item(SidGenerator.generate(), "Key", "An old key", [Action.PICK])
+        torch = make_item("Torch", "A burning torch", [Action.PICK, Action.USE])
+        key = make_item("Key", "An old key", [Action.PICK])
 
         location.add_item(torch)
         location.add_item(key)
@@ -160,13 +189,14 @@ class TestLocation:
         assert torch in location.items
         assert key in location.items
 
-    def test_location_exits_can_be_overwritten(self):
+    def test_location_exits_can_be_overwritten(
+        self, sid_factory: Callable[[], Sid], make_location: Callable[..., Location]
+    ):
         # Arrange
-        location_sid = SidGenerator.generate()
-        location = Location(location_sid, "Changing room")
+        location = make_location("Changing room")
 
-        original_destination = SidGenerator.generate()
-        new_destination = SidGenerator.generate()
+        original_destination = sid_factory()
+        new_destination = sid_factory()
 
         # Act
         location.add_exit(Direction.NORTH, original_destination)
@@ -1,3 +1,5 @@
+from collections.abc import Callable
+
 import pytest
 
 from src.game.domain.player import Sid
@@ -5,54 +7,44 @@ from src.game.domain.world import Action, Direction, Location, World, WorldBuild
 from src.game.infrastructure.sid_generator import SidGenerator
 
 
+@pytest.fixture
+def builder() -> WorldBuilder:
+    """A fresh builder per test; builders keep the locations added to them"""
+    return WorldBuilder()
+
+
+@pytest.fixture(scope="module")
+def starter_world() -> World:
+    """Starter world shared by the read-only tests in this module"""
+    # SIDs provided by external system (tests act as external system)
+    return WorldBuilder().create_starter_world(
+        SidGenerator.generate(),
+        SidGenerator.generate(),
+        SidGenerator.generate(),
+        SidGenerator.generate(),
+    )
+
+
 class TestWorldBuilder:
     """UNIT TEST: WorldBuilder Domain Service
     Tests the WorldBuilder business logic for world construction
     """
 
-    def test_create_starter_world_creates_valid_world(self):
-        # Arrange
-        builder = WorldBuilder()
-        # SIDs provided by external system (tests act as external system)
-        entrance_sid = SidGenerator.generate()
-        north_sid = SidGenerator.generate()
-        east_sid = SidGenerator.generate()
-        torch_sid = SidGenerator.generate()
-
-        # Act
-        world = builder.create_starter_world(entrance_sid, north_sid, east_sid, torch_sid)
-
+    def test_create_starter_world_creates_valid_world(self, starter_world: World):
         # Assert
-        assert isinstance(world, World)
-        assert world.get_starting_location() is not None
-
-    def test_create_starter_world_has_entrance_hall(self):
-        # Arrange
-        builder = WorldBuilder()
-        entrance_sid = SidGenerator.generate()
-        north_sid = SidGenerator.generate()
-        east_sid = SidGenerator.generate()
-        torch_sid = SidGenerator.generate()
+        assert starter_world.get_starting_location() is not None
 
+    def test_create_starter_world_has_entrance_hall(self, starter_world: World):
         # Act
-        world = builder.create_starter_world(entrance_sid, north_sid, east_sid, torch_sid)
-        starting_location = world.get_starting_location()
+        starting_location = starter_world.get_starting_location()
 
         # Assert
         assert "entrance hall" in starting_location.description.lower()
         assert "katacombs" in starting_location.description.lower()
 
-    def test_create_starter_world_has_connected_locations(self):
-        # Arrange
-        builder = WorldBuilder()
-        entrance_sid = SidGenerator.generate()
-        north_sid = SidGenerator.generate()
-        east_sid = SidGenerator.generate()
-        torch_sid = SidGenerator.generate()
-
+    def test_create_starter_world_has_connected_locations(self, starter_world: World):
         # Act
-        world = builder.create_starter_world(entrance_sid, north_sid, east_sid, torch_sid)
-        starting_location = world.get_starting_location()
+        starting_location = starter_world.get_starting_location()
 
         # Assert
         available_directions = starting_location.get_available_directions()
@@ -60,38 +52,24 @@ class TestWorldBuilder:
         assert Direction.EAST in available_directions
         assert len(available_directions) == 2
 
-    def test_create_starter_world_locations_are_bidirectionally_connected(self):
-        # Arrange
-        builder = WorldBuilder()
-        entrance_sid = SidGenerator.generate()
-        north_sid = SidGenerator.generate()
-        east_sid = SidGenerator.generate()
-        torch_sid = SidGenerator.generate()
-
+    def test_create_starter_world_locations_are_bidirectionally_connected(
+        self, starter_world: World
+    ):
         # Act
-        world = builder.create_starter_world(entrance_sid, north_sid, east_sid, torch_sid)
-        starting_location = world.get_starting_location()
+        starting_location = starter_world.get_starting_location()
 
         # Navigate north and back
         north_destination_sid = starting_location.exits[Direction.NORTH]
-        north_location = world.get_location(north_destination_sid)
+        north_location = starter_world.get_location(north_destination_sid)
 
         # Assert
         assert north_location is not None
         assert Direction.SOUTH in north_location.exits
         assert north_location.exits[Direction.SOUTH] == starting_location.sid
 
-    def test_create_starter_world_has_torch_item(self):
-        # Arrange
-        builder = WorldBuilder()
-        entrance_sid = SidGenerator.generate()
-        north_sid = SidGenerator.generate()
-        east_sid = SidGenerator.generate()
-        torch_sid = SidGenerator.generate()
-
+    def test_create_starter_world_has_torch_item(self, starter_world: World):
         # Act
-        world = builder.create_starter_world(entrance_sid, north_sid, east_sid, torch_sid)
-        starting_location = world.get_starting_location()
+        starting_location = starter_world.get_starting_location()
 
         # Assert
         assert len(starting_location.items) == 1
@@ -100,10 +78,11 @@ class TestWorldBuilder:
         assert Action.PICK in torch.available_actions
         assert Action.USE in torch.available_actions
 
-    def test_builder_can_create_custom_world_with_single_location(self):
+    def test_builder_can_create_custom_world_with_single_location(
+        self, sid_factory: Callable[[], Sid], builder: WorldBuilder
+    ):
         # Arrange
-        builder = WorldBuilder()
-        location_sid = SidGenerator.generate()
+        location_sid = sid_factory()
         custom_location = Location(location_sid, "Custom test room")
 
         # Act
@@ -113,13 +92,13 @@ class TestWorldBuilder:
         assert world.get_starting_location() == custom_location
         assert world.has_location(location_sid)
 
-    def test_builder_can_create_custom_world_with_multiple_locations(self):
+    def test_builder_can_create_custom_world_with_multiple_locations(
+        self, sid_factory: Callable[[], Sid], builder: WorldBuilder
+    ):
         # Arrange
-        builder = WorldBuilder()
-
-        location1_sid = SidGenerator.generate()
-        location2_sid = SidGenerator.generate()
-        location3_sid = SidGenerator.generate()
+        location1_sid = sid_factory()
+        location2_sid = sid_factory()
+        location3_sid = sid_factory()
 
         location1 = Location(location1_sid, "First room")
         location2 = Location(location2_sid, "Second room")
@@ -141,10 +120,11 @@ class TestWorldBuilder:
         assert world.has_location(location3_sid)
         assert len(world.get_all_locations()) == 3
 
-    def test_builder_add_location_returns_builder_for_chaining(self):
+    def test_builder_add_location_returns_builder_for_chaining(
+        self, sid_factory: Callable[[], Sid], builder: WorldBuilder
+    ):
         # Arrange
-        builder = WorldBuilder()
-        location = Location(SidGenerator.generate(), "Test room")
+        location = Location(sid_factory(), "Test room")
 
         # Act
         result = builder.add_location(location)
@@ -152,10 +132,11 @@ class TestWorldBuilder:
         # Assert
         assert result is builder  # Builder pattern - returns self
 
-    def test_builder_set_starting_location_returns_builder_for_chaining(self):
+    def test_builder_set_starting_location_returns_builder_for_chaining(
+        self, sid_factory: Callable[[], Sid], builder: WorldBuilder
+    ):
         # Arrange
-        builder = WorldBuilder()
-        location_sid = SidGenerator.generate()
+        location_sid = sid_factory()
 
         # Act
         result = builder.set_starting_location(location_sid)
@@ -163,21 +144,23 @@ class TestWorldBuilder:
         # Assert
         assert result is builder  # Builder pattern - returns self
 
-    def test_builder_throws_error_when_building_without_starting_location(self):
+    def test_builder_throws_error_when_building_without_starting_location(
+        self, sid_factory: Callable[[], Sid], builder: WorldBuilder
+    ):
         # Arrange
-        builder = WorldBuilder()
-        location = Location(SidGenerator.generate(), "Test room")
+        location = Location(sid_factory(), "Test room")
         builder.add_location(location)
 
         # Act & Assert
         with pytest.raises(ValueError, match="Starting location must be set before building world"):
             builder._build()
 
-    def test_builder_throws_error_when_starting_location_not_in_world(self):
+    def test_builder_throws_error_when_starting_location_not_in_world(
+        self, sid_factory: Callable[[], Sid], builder: WorldBuilder
+    ):
         # Arrange
-        builder = WorldBuilder()
-        location_sid = SidGenerator.generate()
-        invalid_starting_sid = SidGenerator.generate()
+        location_sid = sid_factory()
+        invalid_starting_sid = sid_factory()
 
         location = Location(location_sid, "Test room")
         builder.add_location(location)
@@ -187,19 +170,18 @@ class TestWorldBuilder:
         with pytest.raises(ValueError, match="Starting location .* not found in world"):
             builder._build()
 
-    def test_create_starter_world_clears_previous_data(self):
-        # Arrange
-        builder = WorldBuilder()
-
-        # Add some custom data first
-        custom_location = Location(SidGenerator.generate(), "Custom room")
+    def test_create_starter_world_clears_previous_data(
+        self, sid_factory: Callable[[], Sid], builder: WorldBuilder
+    ):
+        # Arrange - Add some custom data first
+        custom_location = Location(sid_factory(), "Custom room")
         builder.add_location(custom_location)
 
         # Act
-        entrance_sid = SidGenerator.generate()
-        north_sid = SidGenerator.generate()
-        east_sid = SidGenerator.generate()
-        torch_sid = SidGenerator.generate()
+        entrance_sid = sid_factory()
+        north_sid = sid_factory()
+        east_sid = sid_factory()
+        torch_sid = sid_factory()
         world = builder.create_starter_world(entrance_sid, north_sid, east_sid, torch_sid)
 
         # Assert - Should not contain the custom location
@@ -212,21 +194,20 @@ class TestWorldBuilder:
         starting_location = world.get_starting_location()
         assert "entrance hall" in starting_location.description.lower()
 
-    def test_multiple_create_starter_world_calls_produce_independent_worlds(self):
-        # Arrange
-        builder = WorldBuilder()
-
+    def test_multiple_create_starter_world_calls_produce_independent_worlds(
+        self, sid_factory: Callable[[], Sid], builder: WorldBuilder
+    ):
         # Act
-        entrance_sid1 = SidGenerator.generate()
-        north_sid1 = SidGenerator.generate()
-        east_sid1 = SidGenerator.generate()
-        torch_sid1 = SidGenerator.generate()
+        entrance_sid1 = sid_factory()
+        north_sid1 = sid_factory()
+        east_sid1 = sid_factory()
+        torch_sid1 = sid_factory()
         world1 = builder.create_starter_world(entrance_sid1, north_sid1, east_sid1, torch_sid1)
 
-        entrance_sid2 = SidGenerator.generate()
-        north_sid2 = SidGenerator.generate()
-        east_sid2 = SidGenerator.generate()
-        torch_sid2 = SidGenerator.generate()
+        entrance_sid2 = sid_factory()
+        north_sid2 = sid_factory()
+        east_sid2 = sid_factory()
+        torch_sid2 = sid_factory()
         world2 = builder.create_starter_world(entrance_sid2, north_sid2, east_sid2, torch_sid2)
 
         # Assert - Worlds should have different locations with different SIDs
@@ -236,16 +217,15 @@ class TestWorldBuilder:
         assert world1_starting.sid != world2_starting.sid
         assert world1_starting.description == world2_starting.description  # Same content
 
-    def test_builder_can_be_reused_after_building(self):
-        # Arrange
-        builder = WorldBuilder()
-
-        # Build first world
-        location1 = Location(SidGenerator.generate(), "First world room")
+    def test_builder_can_be_reused_after_building(
+        self, sid_factory: Callable[[], Sid], builder: WorldBuilder
+    ):
+        # Arrange - Build first world
+        location1 = Location(sid_factory(), "First world room")
         world1 = builder.add_location(location1).set_starting_location(location1.sid)._build()
 
         # Build second world with same builder
-        location2 = Location(SidGenerator.generate(), "Second world room")
+        location2 = Location(sid_factory(), "Second world room")
         world2 = builder.add_location(location2).set_starting_location(location2.sid)._build()
 
         # Assert - Both worlds should be independent
@@ -1,8 +1,9 @@
+from collections.abc import Callable
+
 import pytest
 
 from src.game.domain.player import Sid
-from src.game.domain.world import Location, World
-from src.game.infrastructure.sid_generator import SidGenerator
+from src.game.domain.world import Action, Item, Location, World
 
 
 class TestWorld:
@@ -10,9 +11,11 @@ class TestWorld:
     Tests the World aggregate root business logic and invariants
     """
 
-    def test_world_can_be_created_with_locations_and_starting_location(self):
+    def test_world_can_be_created_with_locations_and_starting_location(
+        self, sid_factory: Callable[[], Sid]
+    ):
         # Arrange
-        location_sid = SidGenerator.generate()
+        location_sid = sid_factory()
         location = Location(location_sid, "Test location")
         locations = {location_sid: location}
 
@@ -24,10 +27,10 @@ class TestWorld:
         assert world.has_location(location_sid)
         assert world.get_location(location_sid) == location
 
-    def test_world_validates_starting_location_exists(self):
+    def test_world_validates_starting_location_exists(self, sid_factory: Callable[[], Sid]):
         # Arrange
-        location_sid = SidGenerator.generate()
-        invalid_starting_sid = SidGenerator.generate()
+        location_sid = sid_factory()
+        invalid_starting_sid = sid_factory()
         location = Location(location_sid, "Test location")
         locations = {location_sid: location}
 
@@ -35,9 +38,9 @@ class TestWorld:
         with pytest.raises(ValueError, match="Starting location .* not found in world"):
             World(locations, invalid_starting_sid)
 
-    def test_get_starting_location_returns_correct_location(self):
+    def test_get_starting_location_returns_correct_location(self, sid_factory: Callable[[], Sid]):
         # Arrange
-        location_sid = SidGenerator.generate()
+        location_sid = sid_factory()
         location = Location(location_sid, "Starting location")
         locations = {location_sid: location}
         world = World(locations, location_sid)
@@ -49,10 +52,12 @@ class TestWorld:
         assert starting_location == location
         assert starting_location.description == "Starting location"
 
-    def test_get_location_returns_none_for_nonexistent_location(self):
+    def test_get_location_returns_none_for_nonexistent_location(
+        self, sid_factory: Callable[[], Sid]
+    ):
         # Arrange
-        location_sid = SidGenerator.generate()
-        nonexistent_sid = SidGenerator.generate()
+        location_sid = sid_factory()
+        nonexistent_sid = sid_factory()
         location = Location(location_sid, "Test location")
         locations = {location_sid: location}
         world = World(locations, location_sid)
@@ -63,9 +68,9 @@ class TestWorld:
         # Assert
         assert result is None
 
-    def test_has_location_returns_true_for_existing_location(self):
+    def test_has_location_returns_true_for_existing_location(self, sid_factory: Callable[[], Sid]):
         # Arrange
-        location_sid = SidGenerator.generate()
+        location_sid = sid_factory()
         location = Location(location_sid, "Test location")
         locations = {location_sid: location}
         world = World(locations, location_sid)
@@ -73,10 +78,12 @@ class TestWorld:
         # Act & Assert
         assert world.has_location(location_sid) is True
 
-    def test_has_location_returns_false_for_nonexistent_location(self):
+    def test_has_location_returns_false_for_nonexistent_location(
+        self, sid_factory: Callable[[], Sid]
+    ):
         # Arrange
-        location_sid = SidGenerator.generate()
-        nonexistent_sid = SidGenerator.generate()
+        location_sid = sid_factory()
+        nonexistent_sid = sid_factory()
         location = Location(location_sid, "Test location")
         locations = {location_sid: location}
         world = World(locations, location_sid)
@@ -84,9 +91,9 @@ class TestWorld:
         # Act & Assert
         assert world.has_location(nonexistent_sid) is False
 
-    def test_get_all_locations_returns_defensive_copy(self):
+    def test_get_all_locations_returns_read_only_view(self, sid_factory: Callable[[], Sid]):
         # Arrange
-        location_sid = SidGenerator.generate()
+        location_sid = sid_factory()
         location = Location(location_sid, "Test location")
         locations = {location_sid: location}
         world = World(locations, location_sid)
@@ -96,15 +103,16 @@ class TestWorld:
 
         # Assert
         assert all_locations == locations
-        assert all_locations is not world._locations  # Defensive copy
+        assert all_locations is world.get_all_locations()  # Same view, no copy
 
-        # Modify returned copy should not affect world
-        all_locations.clear()
-        assert world.has_location(location_sid)  # Original unchanged
+        # Returned view cannot be used to modify the world
+        with pytest.raises(TypeError):
+            all_locations[sid_factory()] = location  # type: ignore[index]
+        assert len(world.get_all_locations()) == 1
 
-    def test_world_creates_defensive_copy_of_input_locations(self):
+    def test_world_creates_defensive_copy_of_input_locations(self, sid_factory: Callable[[], Sid]):
         # Arrange
-        location_sid = SidGenerator.generate()
+        location_sid = sid_factory()
         location = Location(location_sid, "Test location")
         original_locations = {location_sid: location}
         world = World(original_locations, location_sid)
@@ -116,11 +124,11 @@ class TestWorld:
         assert world.has_location(location_sid)
         assert world.get_location(location_sid) == location
 
-    def test_world_with_multiple_locations(self):
+    def test_world_with_multiple_locations(self, sid_factory: Callable[[], Sid]):
         # Arrange
-        location1_sid = SidGenerator.generate()
-        location2_sid = SidGenerator.generate()
-        location3_sid = SidGenerator.generate()
+        location1_sid = sid_factory()
+        location2_sid = sid_factory()
+        location3_sid = sid_factory()
 
         location1 = Location(location1_sid, "First location")
         location2 = Location(location2_sid, "Second location")
@@ -141,4 +149,67 @@ class TestWorld:
         assert world.has_location(location1_sid)
         assert world.has_location(location2_sid)
         assert world.has_location(location3_sid)
-        assert len(world.get_all_locations()) == 3
\ No newline at end of file
+        assert len(world.get_all_locations()) == 3
+
+    def test_get_item_by_sid_finds_item_in_any_location(self, sid_factory: Callable[[], Sid]):
+        # Arrange
+        location1_sid = sid_factory()
+        location2_sid = sid_factory()
+        location1 = Location(location1_sid, "First location")
+        location2 = Location(location2_sid, "Second location")
+        key = Item(sid_factory(), "Key", "An old key", [Action.PICK])
+        location2.add_item(key)
+        world = World({location1_sid: location1, location2_sid: location2}, location1_sid)
+
+        # Act
+        result = world.get_item_by_sid(key.sid)
+
+        # Assert
+        assert result is key
+
+    def test_get_item_by_sid_finds_item_added_after_world_is_built(
+        self, sid_factory: Callable[[], Sid]
+    ):
+        # Arrange
+        location_sid = sid_factory()
+        location = Location(location_sid, "Test location")
+        world = World({location_sid: location}, location_sid)
+        key = Item(sid_factory(), "Key", "An old key", [Action.PICK])
+        world.get_starting_location().add_item(key)
+
+        # Act
+        result = world.get_item_by_sid(key.sid)
+
+        # Assert
+        assert result is key
+
+    def test_get_item_by_sid_returns_none_for_item_removed_from_its_location(
+        self, sid_factory: Callable[[], Sid]
+    ):
+        # Arrange
+        location_sid = sid_factory()
+        location = Location(location_sid, "Test location")
+        torch = Item(sid_factory(), "Torch", "A burning torch", [Action.PICK])
+        location.add_item(torch)
+        world = World({location_sid: location}, location_sid)
+
+        # Act
+        location.items.remove(torch)
+        result = world.get_item_by_sid(torch.sid)
+
+        # Assert
+        assert result is None
+
+    def test_get_item_by_sid_returns_none_for_nonexistent_item(
+        self, sid_factory: Callable[[], Sid]
+    ):
+        # Arrange
+        location_sid = sid_factory()
+        location = Location(location_sid, "Test location")
+        world = World({location_sid: location}, location_sid)
+
+        # Act
+        result = world.get_item_by_sid(sid_factory())
+
+        # Assert
+        assert result is None
@@ -1,8 +1,18 @@
-from fastapi.testclient import TestClient
+from unittest.mock import Mock
 
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from src.game.application.commands import StartGameCommandHandler
 from src.game.infrastructure.adapters.fastapi_app import create_app
 
 
+def _create_client(app: FastAPI) -> AsyncClient:
+    """Call the ASGI app in-process, without TestClient's thread portal"""
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
 class TestGameControllerContract:
     """CONTRACT TEST: HTTP Controllers (Driving Adapters)
     Tests API contracts using real implementations (no mocking)
@@ -13,17 +23,16 @@ class TestGameControllerContract:
     - Application validates SID format but doesn't generate it
     """
 
-    def test_post_game_player_returns_201_with_valid_player_data(self):
-        # Arrange - Use real app with real dependencies
-        app = create_app()
-        client = TestClient(app)
-
-        # Act - Make HTTP request
-        response = client.post(
-            "/game/player",
-            json={"name": "Pedro", "sid": "123456-123456789012-12345678"},
-            headers={"Content-Type": "application/json"},
-        )
+    @pytest.mark.asyncio
+    async def test_post_game_player_returns_201_with_valid_player_data(self, app: FastAPI):
+        # Arrange - Use real app with real dependencies (shared session app)
+        async with _create_client(app) as client:
+            # Act - Make HTTP request
+            response = await client.post(
+                "/game/player",
+                json={"name": "Pedro", "sid": "123456-123456789012-12345678"},
+                headers={"Content-Type": "application/json"},
+            )
 
         # Assert - Verify contract compliance
         assert response.status_code == 201
@@ -47,78 +56,153 @@ class TestGameControllerContract:
         bag = response_data["bag"]
         assert "items" in bag
 
-    def test_post_game_player_with_empty_name_returns_400(self):
+    @pytest.mark.asyncio
+    async def test_post_game_player_with_empty_name_returns_400(self, app: FastAPI):
         # Arrange
-        app = create_app()
-        client = TestClient(app)
-
-        # Act
-        response = client.post(
-            "/game/player",
-            json={"name": "", "sid": "123456-123456789012-12345678"},
-            headers={"Content-Type": "application/json"},
-        )
+        async with _create_client(app) as client:
+            # Act
+            response = await client.post(
+                "/game/player",
+                json={"name": "", "sid": "123456-123456789012-12345678"},
+                headers={"Content-Type": "application/json"},
+            )
 
         # Assert
         assert response.status_code == 400
         assert "application/json" in response.headers["content-type"]
 
-    def test_post_game_player_with_missing_name_returns_422(self):
+    @pytest.mark.asyncio
+    async def test_post_game_player_with_blank_name_returns_400(self, app: FastAPI):
         # Arrange
-        app = create_app()
-        client = TestClient(app)
+        async with _create_client(app) as client:
+            # Act
+            response = await client.post(
+                "/game/player",
+                json={"name": "   ", "sid": "123456-123456789012-12345678"},
+                headers={"Content-Type": "application/json"},
+            )
+
+        # Assert - Domain rule, not schema validation, so 400 rather than 422
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Player name cannot be empty"
 
-        # Act - Send request without name field (but with sid)
-        response = client.post(
-            "/game/player",
-            json={"sid": "123456-123456789012-12345678"},
-            headers={"Content-Type": "application/json"},
-        )
+    @pytest.mark.asyncio
+    async def test_post_game_player_with_missing_name_returns_422(self, app: FastAPI):
+        # Arrange
+        async with _create_client(app) as client:
+            # Act - Send request without name field (but with sid)
+            response = await client.post(
+                "/game/player",
+                json={"sid": "123456-123456789012-12345678"},
+                headers={"Content-Type": "application/json"},
+            )
 
         # Assert - FastAPI validation should return 422
         assert response.status_code == 422
         assert "application/json" in response.headers["content-type"]
 
-    def test_post_game_player_with_missing_sid_returns_422(self):
+    @pytest.mark.asyncio
+    async def test_post_game_player_with_missing_sid_returns_422(self, app: FastAPI):
         # Arrange
-        app = create_app()
-        client = TestClient(app)
-
-        # Act - Send request without sid field (but with name)
-        response = client.post(
-            "/game/player", json={"name": "Pedro"}, headers={"Content-Type": "application/json"}
-        )
+        async with _create_client(app) as client:
+            # Act - Send request without sid field (but with name)
+            response = await client.post(
+                "/game/player", json={"name": "Pedro"}, headers={"Content-Type": "application/json"}
+            )
 
         # Assert - FastAPI validation should return 422 for missing required field
         assert response.status_code == 422
         assert "application/json" in response.headers["content-type"]
 
-    def test_post_game_player_with_invalid_sid_format_returns_400(self):
+    @pytest.mark.asyncio
+    async def test_post_game_player_with_invalid_sid_format_returns_400(self, app: FastAPI):
         # Arrange
-        app = create_app()
-        client = TestClient(app)
-
-        # Act - Send request with invalid SID format
-        response = client.post(
-            "/game/player",
-            json={"name": "Pedro", "sid": "invalid-sid-format"},
-            headers={"Content-Type": "application/json"},
-        )
+        async with _create_client(app) as client:
+            # Act - Send request with invalid SID format
+            response = await client.post(
+                "/game/player",
+                json={"name": "Pedro", "sid": "invalid-sid-format"},
+                headers={"Content-Type": "application/json"},
+            )
 
         # Assert - Should return 400 for invalid SID format (domain validation)
         assert response.status_code == 400
         assert "application/json" in response.headers["content-type"]
 
-    def test_post_game_player_with_empty_fields_returns_422(self):
+    @pytest.mark.asyncio
+    async def test_post_game_player_with_empty_fields_returns_422(self, app: FastAPI):
         # Arrange
-        app = create_app()
-        client = TestClient(app)
-
-        # Act - Send completely empty request
-        response = client.post(
-            "/game/player", json={}, headers={"Content-Type": "application/json"}
-        )
+        async with _create_client(app) as client:
+            # Act - Send completely empty request
+            response = await client.post(
+                "/game/player", json={}, headers={"Content-Type": "application/json"}
+            )
 
         # Assert - FastAPI validation should return 422 for missing required fields
         assert response.status_code == 422
         assert "application/json" in response.headers["content-type"]
+
+    @pytest.mark.asyncio
+    async def test_players_started_on_same_app_share_one_world(self, app: FastAPI):
+        # Arrange
+        async with _create_client(app) as client:
+            # Act
+            first = await client.post(
+                "/game/player", json={"name": "Pedro", "sid": "123456-123456789012-12345678"}
+            )
+            second = await client.post(
+                "/game/player", json={"name": "Ana", "sid": "654321-123456789012-12345678"}
+            )
+
+        # Assert - World is built once per app, so starting items keep their SIDs
+        assert first.status_code == 201
+        assert second.status_code == 201
+        assert first.json()["location"]["items"] == second.json()["location"]["items"]
+
+    @pytest.mark.asyncio
+    async def test_started_player_is_projected_into_the_read_model(self, app: FastAPI):
+        # Arrange
+        player_sid = "777777-123456789012-12345678"
+        async with _create_client(app) as client:
+            # Act
+            response = await client.post("/game/player", json={"name": "Pedro", "sid": player_sid})
+
+        # Assert - The write-side repository keeps the app's projection current
+        assert response.status_code == 201
+        details = app.state.player_projection_repository.get_player_details(player_sid)
+        assert details is not None
+        assert details.name == "Pedro"
+
+    @pytest.mark.asyncio
+    async def test_openapi_documents_typed_player_response(self, app: FastAPI):
+        # Arrange
+        async with _create_client(app) as client:
+            # Act
+            response = await client.get("/openapi.json")
+
+        # Assert - Nested location and bag payloads are described, not free-form objects
+        schemas = response.json()["components"]["schemas"]
+        player_properties = schemas["PlayerResponse"]["properties"]
+        assert player_properties["location"] == {"$ref": "#/components/schemas/LocationResponse"}
+        assert player_properties["bag"] == {"$ref": "#/components/schemas/BagResponse"}
+        assert "ItemResponse" in schemas
+
+    @pytest.mark.asyncio
+    async def test_unexpected_error_returns_generic_json_500(self):
+        # Arrange - A dedicated app whose handler fails unexpectedly
+        app = create_app()
+        failing_handler = Mock(spec=StartGameCommandHandler)
+        failing_handler.execute.side_effect = RuntimeError("database password is hunter2")
+        app.state.start_game_command_handler = failing_handler
+        transport = ASGITransport(app=app, raise_app_exceptions=False)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            # Act
+            response = await client.post(
+                "/game/player", json={"name": "Pedro", "sid": "123456-123456789012-12345678"}
+            )
+
+        # Assert - JSON error body without the exception text
+        assert response.status_code == 500
+        assert "application/json" in response.headers["content-type"]
+        assert response.json() == {"detail": "Internal server error"}
+        assert "hunter2" not in response.text
@@ -0,0 +1,47 @@
+from collections.abc import Callable
+
+import pytest
+
+from src.game.domain.player import Sid
+from src.game.domain.world import Location, World
+from src.game.infrastructure.repositories.in_memory_player_projection_repository import (
+    InMemoryPlayerProjectionRepository,
+)
+from src.game.infrastructure.repositories.in_memory_player_repository import (
+    InMemoryPlayerRepository,
+)
+from src.game.infrastructure.repositories.in_memory_world_repository import (
+    InMemoryWorldRepository,
+)
+
+
+@pytest.fixture(scope="session")
+def default_world_repo() -> InMemoryWorldRepository:
+    """The starter world is read-only, so build it once for every repository test"""
+    return InMemoryWorldRepository()
+
+
+@pytest.fixture
+def player_repo() -> InMemoryPlayerRepository:
+    """An empty write-side player repository per test"""
+    return InMemoryPlayerRepository()
+
+
+@pytest.fixture
+def hall(sid_factory: Callable[[], Sid]) -> Location:
+    """The single location of the world the projection tests run against"""
+    return Location(sid_factory(), "A dark hall")
+
+
+@pytest.fixture
+def projection(hall: Location) -> InMemoryPlayerProjectionRepository:
+    """An empty read-side projection over a one-location world"""
+    return InMemoryPlayerProjectionRepository(World({hall.sid: hall}, hall.sid))
+
+
+@pytest.fixture
+def projected_player_repo(
+    projection: InMemoryPlayerProjectionRepository,
+) -> InMemoryPlayerRepository:
+    """A write-side player repository that keeps the projection current"""
+    return InMemoryPlayerRepository(projection)
@@ -0,0 +1,101 @@
+from collections.abc import Callable
+
+from src.game.domain.player import Player
+from src.game.domain.world import Location
+from src.game.infrastructure.repositories.in_memory_player_projection_repository import (
+    InMemoryPlayerProjectionRepository,
+)
+from src.game.infrastructure.repositories.in_memory_player_repository import (
+    InMemoryPlayerRepository,
+)
+
+
+class TestPlayerProjectionRepository:
+    """INTEGRATION TEST: Player Projection Repository Implementation (READ-SIDE)
+    Tests that the read model is kept current by the write-side repository
+    """
+
+    def test_saved_player_is_listed_with_location_description(
+        self,
+        projected_player_repo: InMemoryPlayerRepository,
+        projection: InMemoryPlayerProjectionRepository,
+        hall: Location,
+        make_player: Callable[..., Player],
+    ):
+        # Arrange
+        player = make_player(location_sid=hall.sid)
+
+        # Act
+        projected_player_repo.save(player)
+        players = projection.find_all_active_players()
+
+        # Assert
+        assert len(players) == 1
+        assert players[0].sid == player.sid.value
+        assert players[0].name == "Pedro"
+        assert players[0].location_description == "A dark hall"
+
+    def test_get_player_details_returns_projected_player(
+        self,
+        projected_player_repo: InMemoryPlayerRepository,
+        projection: InMemoryPlayerProjectionRepository,
+        hall: Location,
+        make_player: Callable[..., Player],
+    ):
+        # Arrange
+        player = make_player(location_sid=hall.sid)
+        projected_player_repo.save(player)
+
+        # Act
+        details = projection.get_player_details(player.sid.value)
+
+        # Assert
+        assert details is not None
+        assert details.location_sid == hall.sid.value
+        assert details.bag_item_count == 0
+        assert details.is_active is True
+
+    def test_saving_inactive_player_removes_it_from_active_list(
+        self,
+        projected_player_repo: InMemoryPlayerRepository,
+        projection: InMemoryPlayerProjectionRepository,
+        hall: Location,
+        make_player: Callable[..., Player],
+    ):
+        # Arrange
+        player = make_player(location_sid=hall.sid)
+        projected_player_repo.save(player)
+
+        # Act
+        player.quit_game()
+        projected_player_repo.save(player)
+
+        # Assert
+        assert projection.find_all_active_players() == []
+
+    def test_deleted_player_is_removed_from_projection(
+        self,
+        projected_player_repo: InMemoryPlayerRepository,
+        projection: InMemoryPlayerProjectionRepository,
+        hall: Location,
+        make_player: Callable[..., Player],
+    ):
+        # Arrange
+        player = make_player(location_sid=hall.sid)
+        projected_player_repo.save(player)
+
+        # Act
+        projected_player_repo.delete(player.sid)
+
+        # Assert
+        assert projection.find_all_active_players() == []
+        assert projection.get_player_details(player.sid.value) is None
+
+    def test_get_player_details_with_malformed_sid_returns_none(
+        self, projection: InMemoryPlayerProjectionRepository
+    ):
+        # Act
+        details = projection.get_player_details("not-a-sid")
+
+        # Assert
+        assert details is None
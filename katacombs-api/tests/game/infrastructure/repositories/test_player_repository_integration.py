@@ -1,8 +1,9 @@
-from src.game.domain.player import Bag, Player, Sid
+from collections.abc import Callable
+
+from src.game.domain.player import Player, Sid
 from src.game.infrastructure.repositories.in_memory_player_repository import (
     InMemoryPlayerRepository,
 )
-from src.game.infrastructure.sid_generator import SidGenerator
 
 
 class TestPlayerRepository:
@@ -14,16 +15,15 @@ class TestPlayerRepository:
     For query operations, see tests for PlayerProjectionRepository.
     """
 
-    def test_save_and_find_player_by_sid(self):
+    def test_save_and_find_player_by_sid(
+        self, player_repo: InMemoryPlayerRepository, make_player: Callable[..., Player]
+    ):
         # Arrange
-        repo = InMemoryPlayerRepository()
-        player_sid = SidGenerator.generate()
-        location_sid = SidGenerator.generate()
-        player = Player.create(player_sid, "Pedro", location_sid, Bag())
+        player = make_player()
 
         # Act - Save player
-        repo.save(player)
-        retrieved_player = repo.find_by_sid(player_sid)
+        player_repo.save(player)
+        retrieved_player = player_repo.find_by_sid(player.sid)
 
         # Assert - Verify data persistence and retrieval
         assert retrieved_player is not None
@@ -31,30 +31,29 @@ class TestPlayerRepository:
         assert retrieved_player.name == player.name
         assert retrieved_player.is_active == player.is_active
 
-    def test_delete_player(self):
+    def test_delete_player(
+        self, player_repo: InMemoryPlayerRepository, make_player: Callable[..., Player]
+    ):
         # Arrange
-        repo = InMemoryPlayerRepository()
-        player_sid = SidGenerator.generate()
-        location_sid = SidGenerator.generate()
-        player = Player.create(player_sid, "Pedro", location_sid, Bag())
-
-        repo.save(player)
+        player = make_player()
+        player_repo.save(player)
 
         # Act
-        result = repo.delete(player_sid)
-        retrieved_player = repo.find_by_sid(player_sid)
+        result = player_repo.delete(player.sid)
+        retrieved_player = player_repo.find_by_sid(player.sid)
 
         # Assert
         assert result is True
         assert retrieved_player is None
 
-    def test_find_nonexistent_player_returns_none(self):
+    def test_find_nonexistent_player_returns_none(
+        self, player_repo: InMemoryPlayerRepository, sid_factory: Callable[[], Sid]
+    ):
         # Arrange
-        repo = InMemoryPlayerRepository()
-        nonexistent_sid = SidGenerator.generate()
+        nonexistent_sid = sid_factory()
 
         # Act
-        result = repo.find_by_sid(nonexistent_sid)
+        result = player_repo.find_by_sid(nonexistent_sid)
 
         # Assert
         assert result is None
@@ -1,5 +1,4 @@
-from src.game.domain.player import Sid
-from src.game.domain.world import Action, Direction, Item, Location, World, WorldBuilder
+from src.game.domain.world import Action, Direction, Item, Location, WorldBuilder
 from src.game.infrastructure.repositories.in_memory_world_repository import (
     InMemoryWorldRepository,
 )
@@ -40,12 +39,11 @@ class TestWorldRepository:
         assert retrieved_location.items[0].name == "Key"
         assert Direction.NORTH in retrieved_location.exits
 
-    def test_find_starting_location_with_default_world(self):
-        # Arrange
-        repo = InMemoryWorldRepository()
-
+    def test_find_starting_location_with_default_world(
+        self, default_world_repo: InMemoryWorldRepository
+    ):
         # Act
-        world = repo.get_world()
+        world = default_world_repo.get_world()
         starting_location = world.get_starting_location()
 
         # Assert
@@ -74,24 +72,17 @@ class TestWorldRepository:
         assert retrieved_starting.sid == starting_sid
         assert retrieved_starting.description == "Custom starting room"
 
-    def test_get_world_returns_complete_world(self):
-        # Arrange
-        repo = InMemoryWorldRepository()
-
+    def test_get_world_returns_complete_world(self, default_world_repo: InMemoryWorldRepository):
         # Act
-        world = repo.get_world()
+        world = default_world_repo.get_world()
 
         # Assert
         assert world is not None
-        assert isinstance(world, World)
         assert world.get_starting_location() is not None
 
-    def test_default_world_structure(self):
-        # Arrange
-        repo = InMemoryWorldRepository()
-
+    def test_default_world_structure(self, default_world_repo: InMemoryWorldRepository):
         # Act
-        world = repo.get_world()
+        world = default_world_repo.get_world()
         starting_location = world.get_starting_location()
 
         # Assert - Verify the default world has expected structure
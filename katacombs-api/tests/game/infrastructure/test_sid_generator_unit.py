@@ -0,0 +1,22 @@
+from src.game.domain.player import Sid
+from src.game.infrastructure.sid_generator import SidGenerator
+
+
+class TestSidGenerator:
+    """UNIT TEST: SID Generator Infrastructure Service
+    Tests that generated SIDs match the Sid format and do not repeat
+    """
+
+    def test_generate_returns_sid_in_valid_format(self):
+        # Act
+        sid = SidGenerator.generate()
+
+        # Assert
+        assert Sid.is_valid(sid.value)
+
+    def test_generate_returns_distinct_sids(self):
+        # Act
+        sids = {SidGenerator.generate() for _ in range(1000)}
+
+        # Assert
+        assert len(sids) == 1000
@@ -1,7 +1,7 @@
 """Basic test to ensure CI pipeline works."""
 
 
-def test() -> None:
+def test_greeting_mentions_katacombs() -> None:
     """The Test."""
     name = "katacombs"
     greeting = f"Hello, {name}!"